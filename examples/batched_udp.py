@@ -0,0 +1,249 @@
+"""
+Batched UDP datapath for the example QUIC servers.
+
+asyncio's default datagram transport performs one ``recvfrom`` per event loop
+wakeup, so a burst of N datagrams costs N trips through the selector. The
+transport below drains the socket until it would block (up to a batch limit)
+each time it becomes readable. Datagrams are read into a preallocated
+buffer sized for QUIC packets and copied out at their exact size, rather than
+asking the kernel for a 64 KiB ``bytes`` object per datagram.
+
+On the send side, datagrams emitted inside :meth:`BatchedDatagramTransport.batch`
+are queued and flushed together. Each receive batch is processed inside such a
+block, so replies to a burst of datagrams leave in one flush. On Linux, runs of
+equally-sized datagrams bound for the same peer are handed to the kernel in a
+single ``sendmsg`` call using UDP generic segmentation offload (``UDP_SEGMENT``).
+"""
+
+import asyncio
+import errno
+import socket
+import struct
+import sys
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from aioquic.asyncio.server import QuicServer
+
+__all__ = ["BatchedDatagramTransport", "serve_batched"]
+
+# receive buffer size, QUIC endpoints do not send datagrams above the path MTU
+RECV_BUFFER_SIZE = 2048
+
+# maximum number of datagrams read per wakeup, to avoid starving other callbacks
+MAX_RECV_BATCH = 64
+
+# generic segmentation offload, see udp(7)
+if sys.platform == "linux":
+    SOL_UDP = getattr(socket, "SOL_UDP", 17)
+    UDP_SEGMENT: Optional[int] = getattr(socket, "UDP_SEGMENT", 103)
+else:
+    UDP_SEGMENT = None
+
+# the kernel refuses to split a buffer into more segments than this
+MAX_GSO_SEGMENTS = 64
+
+# a GSO buffer must still fit in a single UDP payload
+MAX_GSO_PAYLOAD = 65507
+
+# errors indicating the kernel or the NIC cannot perform segmentation offload
+GSO_UNSUPPORTED_ERRNOS = (errno.EINVAL, errno.EIO, errno.ENOPROTOOPT, errno.EOPNOTSUPP)
+
+
+class BatchedDatagramTransport(asyncio.DatagramTransport):
+    """
+    A datagram transport which drains all pending datagrams on each wakeup.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        sock: socket.socket,
+        protocol: asyncio.DatagramProtocol,
+    ) -> None:
+        super().__init__(extra={"socket": sock, "sockname": sock.getsockname()})
+        self._batch_depth = 0
+        self._closing = False
+        self._gso_enabled = UDP_SEGMENT is not None
+        self._loop = loop
+        self._pending: List[Tuple[bytes, Any]] = []
+        self._protocol = protocol
+        self._recv_buffer = memoryview(bytearray(RECV_BUFFER_SIZE))
+        self._sock = sock
+
+        sock.setblocking(False)
+        protocol.connection_made(self)
+        loop.add_reader(sock.fileno(), self._read_ready)
+
+    def abort(self) -> None:
+        self.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Queue datagrams sent within the block and flush them on exit.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending:
+                self._flush()
+
+    def close(self) -> None:
+        if self._closing:
+            return
+        if self._pending:
+            self._flush()
+        self._closing = True
+        self._loop.remove_reader(self._sock.fileno())
+        self._loop.call_soon(self._connection_lost)
+
+    def get_protocol(self) -> asyncio.BaseProtocol:
+        return self._protocol
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def sendto(self, data: bytes, addr: Optional[Tuple[Any, ...]] = None) -> None:
+        if self._closing:
+            return
+        if self._batch_depth:
+            self._pending.append((data, addr))
+        else:
+            self._send(data, addr)
+
+    def _connection_lost(self) -> None:
+        try:
+            self._protocol.connection_lost(None)
+        finally:
+            self._sock.close()
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, []
+        count = len(pending)
+        start = 0
+        while start < count:
+            data, addr = pending[start]
+            segment_size = len(data)
+            end = start + 1
+
+            # extend the run with datagrams of the same size for the same peer,
+            # only the last segment of a run may be shorter
+            if self._gso_enabled and segment_size:
+                max_segments = min(MAX_GSO_SEGMENTS, MAX_GSO_PAYLOAD // segment_size)
+                while (
+                    end < count
+                    and end - start < max_segments
+                    and pending[end][1] == addr
+                    and len(pending[end][0]) <= segment_size
+                ):
+                    end += 1
+                    if len(pending[end - 1][0]) < segment_size:
+                        break
+
+            if end - start == 1:
+                self._send(data, addr)
+            else:
+                self._send_segments(
+                    [datagram for datagram, _ in pending[start:end]],
+                    segment_size,
+                    addr,
+                )
+            start = end
+
+    def _send_segments(
+        self, segments: List[bytes], segment_size: int, addr: Any
+    ) -> None:
+        try:
+            self._sock.sendmsg(
+                [b"".join(segments)],
+                [(SOL_UDP, UDP_SEGMENT, struct.pack("@H", segment_size))],
+                0,
+                addr,
+            )
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as exc:
+            if exc.errno not in GSO_UNSUPPORTED_ERRNOS:
+                self._protocol.error_received(exc)
+                return
+
+            # fall back to one datagram per syscall
+            self._gso_enabled = False
+            for segment in segments:
+                self._send(segment, addr)
+
+    def _read_ready(self) -> None:
+        # datagrams sent while handling the batch are flushed together
+        with self.batch():
+            for _ in range(MAX_RECV_BATCH):
+                if self._closing:
+                    return
+                try:
+                    size, _, flags, addr = self._sock.recvmsg_into(
+                        [self._recv_buffer]
+                    )
+                except (BlockingIOError, InterruptedError):
+                    return
+                except OSError as exc:
+                    self._protocol.error_received(exc)
+                    return
+
+                # drop datagrams which did not fit in the buffer
+                if flags & socket.MSG_TRUNC:
+                    continue
+
+                # the buffer is reused, so hand over a copy
+                self._protocol.datagram_received(
+                    bytes(self._recv_buffer[:size]), addr
+                )
+
+    def _send(self, data: bytes, addr: Any) -> None:
+        try:
+            self._sock.sendto(data, addr)
+        except (BlockingIOError, InterruptedError):
+            # the socket buffer is full, QUIC loss recovery will retransmit
+            pass
+        except OSError as exc:
+            self._protocol.error_received(exc)
+
+
+async def serve_batched(
+    host: str,
+    port: int,
+    *,
+    create_server: Callable[[], QuicServer],
+    reuse_port: bool = False,
+) -> QuicServer:
+    """
+    Start a QUIC server at the given `host` and `port` using a
+    :class:`BatchedDatagramTransport`.
+
+    ``create_server`` is a callable returning the
+    :class:`~aioquic.asyncio.server.QuicServer`, it is typically a
+    :func:`functools.partial` carrying the same arguments as
+    :func:`aioquic.asyncio.serve`.
+
+    If ``reuse_port`` is `True`, the socket is bound with ``SO_REUSEPORT`` so
+    that several processes can listen on the same address, the kernel then
+    spreads datagrams between them by hashing the 4-tuple.
+    """
+    loop = asyncio.get_running_loop()
+
+    family, type_, proto, _, addr = (
+        await loop.getaddrinfo(host, port, type=socket.SOCK_DGRAM)
+    )[0]
+    sock = socket.socket(family, type_, proto)
+    try:
+        if reuse_port:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(addr)
+    except OSError:
+        sock.close()
+        raise
+
+    server = create_server()
+    BatchedDatagramTransport(loop, sock, server)
+    return server
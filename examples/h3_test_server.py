@@ -3,22 +3,33 @@
 """
 Simple HTTP/3 Test Server for Non-Conformance Testing
 
-This server logs all incoming frames and can be used to test how 
+This server logs all incoming frames and can be used to test how
 non-conformant HTTP/3 behavior is handled.
 """
 
+import argparse
 import asyncio
 import logging
-import ssl
-from typing import Dict, Optional
+import multiprocessing
+import os
+from functools import partial
+from typing import Optional
 
-from aioquic.asyncio import serve
 from aioquic.asyncio.protocol import QuicConnectionProtocol
+from aioquic.asyncio.server import QuicServer
 from aioquic.h3.connection import H3_ALPN, H3Connection
-from aioquic.h3.events import DataReceived, H3Event, HeadersReceived
+from aioquic.h3.events import DataReceived, H3Event, Headers, HeadersReceived
 from aioquic.quic.configuration import QuicConfiguration
 from aioquic.quic.events import QuicEvent
-from aioquic.tls import SessionTicket
+from batched_udp import serve_batched
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# uvloop.run() creates its own loop, leaving the global event loop policy alone
+_run = uvloop.run if uvloop is not None else asyncio.run
 
 # Enable debug logging
 logging.basicConfig(
@@ -27,119 +38,167 @@ logging.basicConfig(
 )
 logger = logging.getLogger("h3_test_server")
 
+# Pre-encoded responses, only the request line and stream ID vary
+RESPONSE_HEADERS = [
+    (b":status", b"200"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"server", b"aioquic-test-server"),
+]
+RESPONSE_BODY_TEMPLATE = (
+    b"Hello from HTTP/3 test server!\n"
+    b"You requested: %s %s\n"
+    b"Stream ID: %d\n"
+    b"This server logs all non-conformant behavior.\n"
+)
+
 
 class H3TestServerProtocol(QuicConnectionProtocol):
     """
     Test server protocol that logs all HTTP/3 events.
     """
-    
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._http: Optional[H3Connection] = None
-        self._request_handlers: Dict[int, asyncio.Task] = {}
         logger.info("🟢 New client connection established")
-    
+
+    def transmit(self) -> None:
+        """Send pending datagrams, coalescing them into as few syscalls as possible."""
+        with self._transport.batch():
+            super().transmit()
+
     def quic_event_received(self, event: QuicEvent) -> None:
         """Handle QUIC events and route to HTTP layer."""
-        logger.debug(f"📡 QUIC event: {type(event).__name__}")
-        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("QUIC: event %s", type(event).__name__)
+
         # Initialize HTTP connection if not done yet
         if self._http is None:
             self._http = H3Connection(self._quic)
             logger.info("🔗 HTTP/3 connection initialized")
-        
+
         # Process HTTP events
         try:
             for http_event in self._http.handle_event(event):
                 self.http_event_received(http_event)
         except Exception as e:
-            logger.error(f"❌ Error processing HTTP event: {e}")
+            logger.error("H3: error processing HTTP event: %s", e)
             # Log the specific exception for non-conformance analysis
-            logger.error(f"🔍 Exception type: {type(e).__name__}")
-            logger.error(f"🔍 Exception details: {str(e)}")
-    
+            logger.error("H3: exception type: %s", type(e).__name__)
+            logger.error("H3: exception details: %s", e)
+
     def http_event_received(self, event: H3Event) -> None:
         """Handle HTTP/3 events."""
-        logger.info(f"📥 HTTP/3 event: {type(event).__name__}")
-        
-        if isinstance(event, HeadersReceived):
-            logger.info(f"📋 Headers received on stream {event.stream_id}:")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("H3: event %s", type(event).__name__)
+
+        handler = self._event_handlers.get(type(event))
+        if handler is not None:
+            handler(self, event)
+
+    def _headers_received(self, event: HeadersReceived) -> None:
+        """Log the request headers and answer the request."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("H3: headers received on stream %d:", event.stream_id)
             for name, value in event.headers:
-                logger.info(f"   {name.decode()}: {value.decode()}")
-            
-            # Create task to handle the request
-            task = asyncio.create_task(
-                self._handle_request(event.stream_id, event.headers)
-            )
-            self._request_handlers[event.stream_id] = task
-            
-        elif isinstance(event, DataReceived):
-            logger.info(f"📦 Data received on stream {event.stream_id}: {len(event.data)} bytes")
-            if event.stream_ended:
-                logger.info(f"🔚 Stream {event.stream_id} ended")
-    
-    async def _handle_request(self, stream_id: int, headers) -> None:
+                logger.info("   %s: %s", name.decode(), value.decode())
+
+        # Answer right away, the response is flushed once the received
+        # datagrams have been processed
+        self._handle_request(event.stream_id, event.headers)
+
+    def _data_received(self, event: DataReceived) -> None:
+        """Log the request body."""
+        logger.info(
+            "H3: data received on stream %d: %d bytes",
+            event.stream_id,
+            len(event.data),
+        )
+        if event.stream_ended:
+            logger.info("H3: stream %d ended", event.stream_id)
+
+    # HTTP/3 event handlers, keyed by exact event class
+    _event_handlers = {
+        HeadersReceived: _headers_received,
+        DataReceived: _data_received,
+    }
+
+    def _handle_request(self, stream_id: int, headers: Headers) -> None:
         """Handle an HTTP request."""
         try:
-            # Extract method and path
-            method = None
-            path = None
-            for name, value in headers:
-                if name == b":method":
-                    method = value.decode()
-                elif name == b":path":
-                    path = value.decode()
-            
-            logger.info(f"🚀 Handling {method} {path} on stream {stream_id}")
-            
-            # Send a simple response
-            response_headers = [
-                (b":status", b"200"),
-                (b"content-type", b"text/plain; charset=utf-8"),
-                (b"server", b"aioquic-test-server"),
-            ]
-            
-            self._http.send_headers(stream_id, response_headers)
-            
-            response_body = (
-                f"Hello from HTTP/3 test server!\n"
-                f"You requested: {method} {path}\n"
-                f"Stream ID: {stream_id}\n"
-                f"This server logs all non-conformant behavior.\n"
-            ).encode()
-            
-            self._http.send_data(stream_id, response_body, end_stream=True)
-            logger.info(f"✅ Response sent for stream {stream_id}")
-            
+            # Extract method and path, kept as bytes for the response body
+            request_headers = dict(headers)
+            method = request_headers.get(b":method", b"")
+            path = request_headers.get(b":path", b"")
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "REQ: handling %s %s on stream %d",
+                    method.decode(),
+                    path.decode(),
+                    stream_id,
+                )
+
+            # Send a simple response, the body is built in a single allocation
+            self._http.send_headers(stream_id, RESPONSE_HEADERS)
+            self._http.send_data(
+                stream_id,
+                RESPONSE_BODY_TEMPLATE % (method, path, stream_id),
+                end_stream=True,
+            )
+            logger.info("REQ: response sent for stream %d", stream_id)
+
         except Exception as e:
-            logger.error(f"❌ Error handling request on stream {stream_id}: {e}")
-        finally:
-            # Clean up the task
-            if stream_id in self._request_handlers:
-                del self._request_handlers[stream_id]
+            logger.error("REQ: error handling request on stream %d: %s", stream_id, e)
 
 
-def create_certificate_files():
-    """Create temporary SSL certificate files for testing."""
+def create_certificate_file():
+    """
+    Return a PEM file holding an SSL certificate and its key for testing.
+
+    The file is cached in a per-user directory and only regenerated when
+    missing or about to expire.
+    """
+    import datetime
     import tempfile
-    import os
+    from pathlib import Path
+
     from cryptography import x509
-    from cryptography.x509.oid import NameOID
     from cryptography.hazmat.primitives import hashes, serialization
-    from cryptography.hazmat.primitives.asymmetric import rsa
-    import datetime
-    
-    # Generate private key
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=2048,
-    )
-    
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(cache_home) / "aioquic-test-server"
+    pem_path = cache_dir / "localhost.pem"
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    # Only trust a cache directory nobody else can write to
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    cache_stat = cache_dir.stat()
+    if cache_stat.st_uid != os.getuid() or cache_stat.st_mode & 0o077:
+        raise PermissionError(
+            f"{cache_dir} must be owned by the current user and private (mode 0700)"
+        )
+
+    # Reuse the cached certificate unless it expires within a day
+    if pem_path.exists():
+        try:
+            cached = x509.load_pem_x509_certificate(pem_path.read_bytes())
+        except ValueError:
+            pass
+        else:
+            if cached.not_valid_after_utc > now + datetime.timedelta(days=1):
+                return str(pem_path)
+
+    # Generate private key, EC key generation is much cheaper than RSA
+    private_key = ec.generate_private_key(ec.SECP256R1())
+
     # Create certificate
     subject = issuer = x509.Name([
         x509.NameAttribute(NameOID.COMMON_NAME, "localhost"),
     ])
-    
+
     cert = x509.CertificateBuilder().subject_name(
         subject
     ).issuer_name(
@@ -149,91 +208,118 @@ def create_certificate_files():
     ).serial_number(
         x509.random_serial_number()
     ).not_valid_before(
-        datetime.datetime.now(datetime.timezone.utc)
+        now
     ).not_valid_after(
-        datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=365)
+        now + datetime.timedelta(days=365)
     ).add_extension(
         x509.SubjectAlternativeName([
             x509.DNSName("localhost"),
         ]),
         critical=False,
     ).sign(private_key, hashes.SHA256())
-    
-    # Create temporary files
-    cert_file = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pem')
-    key_file = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pem')
-    
-    # Write certificate and key
-    cert_file.write(cert.public_bytes(serialization.Encoding.PEM))
-    cert_file.close()
-    
-    key_file.write(private_key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption()
-    ))
-    key_file.close()
-    
-    return cert_file.name, key_file.name
-
-
-async def main():
+
+    # Write the certificate and its key to a single file replaced atomically,
+    # so concurrent servers never load a partial file or a mismatched pair
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix='.pem')
+    with os.fdopen(fd, 'wb') as tmp_file:
+        tmp_file.write(cert.public_bytes(serialization.Encoding.PEM))
+        tmp_file.write(private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ))
+    os.replace(tmp_name, pem_path)
+
+    return str(pem_path)
+
+
+async def main(host: str = "localhost", port: int = 4433, reuse_port: bool = False):
     """Run the HTTP/3 test server."""
-    host = "localhost"
-    port = 4433
-    
     logger.info("🚀 Starting HTTP/3 Test Server")
     logger.info("=====================================")
     logger.info(f"📡 Listening on: {host}:{port}")
     logger.info("🔍 This server logs all non-conformant HTTP/3 behavior")
     logger.info("⚠️  Using self-signed certificate for testing")
-    
-    # Create temporary certificate files
-    cert_file, key_file = create_certificate_files()
-    
-    try:
-        # Create QUIC configuration
-        configuration = QuicConfiguration(
-            alpn_protocols=H3_ALPN,
-            is_client=False,
-            max_datagram_frame_size=65536,
-        )
-        
-        # Load certificate and private key
-        configuration.load_cert_chain(cert_file, key_file)
-        
-        # Start server
-        server = await serve(
-            host=host,
-            port=port,
+
+    # Load (or create once) the cached certificate file
+    pem_file = create_certificate_file()
+
+    # Create QUIC configuration
+    configuration = QuicConfiguration(
+        alpn_protocols=H3_ALPN,
+        is_client=False,
+        max_datagram_frame_size=65536,
+    )
+
+    # Load certificate and private key, both stored in the same file
+    configuration.load_cert_chain(pem_file)
+
+    # Start server, draining the UDP socket in batches on each wakeup
+    server = await serve_batched(
+        host,
+        port,
+        create_server=partial(
+            QuicServer,
             configuration=configuration,
             create_protocol=H3TestServerProtocol,
-        )
-        
-        logger.info("✅ Server started successfully!")
-        logger.info("💡 Run the non-conformance test client to test protocol violations")
-        logger.info("🛑 Press Ctrl+C to stop the server")
-        
-        try:
-            # Keep server running forever
-            await asyncio.Future()
-        except KeyboardInterrupt:
-            logger.info("🛑 Server stopped by user")
-        finally:
-            server.close()
-            
+        ),
+        reuse_port=reuse_port,
+    )
+
+    logger.info("✅ Server started successfully!")
+    logger.info("💡 Run the non-conformance test client to test protocol violations")
+    logger.info("🛑 Press Ctrl+C to stop the server")
+
+    try:
+        # Keep server running forever
+        await asyncio.Future()
+    except KeyboardInterrupt:
+        logger.info("🛑 Server stopped by user")
     finally:
-        # Clean up temporary certificate files
-        import os
-        try:
-            os.unlink(cert_file)
-            os.unlink(key_file)
-        except FileNotFoundError:
-            pass
+        server.close()
+
+
+def run_worker(host: str, port: int) -> None:
+    """Run one server process sharing the listening port with its siblings."""
+    try:
+        _run(main(host, port, reuse_port=True))
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP/3 test server")
+    parser.add_argument(
+        "--host", default="localhost", help="Host to bind to (default: localhost)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=4433, help="Port to bind to (default: 4433)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Number of server processes sharing the port with SO_REUSEPORT "
+            "(0: one per CPU, default: 1)"
+        ),
+    )
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count()
+
     try:
-        asyncio.run(main())
+        if workers == 1:
+            _run(main(args.host, args.port))
+        else:
+            # Create the certificate before forking so all workers share it
+            create_certificate_file()
+            processes = [
+                multiprocessing.Process(target=run_worker, args=(args.host, args.port))
+                for _ in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
     except KeyboardInterrupt:
-        print("\n�� Server stopped") 
\ No newline at end of file
+        print("\n�� Server stopped")
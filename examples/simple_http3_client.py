@@ -6,9 +6,13 @@ A lightweight HTTP/3 client built on top of aioquic.
 """
 
 import asyncio
+import json
 import logging
 import ssl
-from typing import Dict, Optional, Union
+import threading
+from contextlib import AsyncExitStack
+from functools import cached_property, partial
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from aioquic.asyncio.client import connect
 from aioquic.asyncio.protocol import QuicConnectionProtocol
@@ -18,8 +22,18 @@ from aioquic.quic.configuration import QuicConfiguration
 from aioquic.quic.events import QuicEvent
 from aioquic.tls import SessionTicket
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger("simple_http3_client")
 
+# Pre-encoded values for the request headers
+_METHOD_BYTES = {"GET": b"GET", "POST": b"POST"}
+_SCHEME_HEADER = (b":scheme", b"https")
+_USER_AGENT_HEADER = (b"user-agent", b"simple-http3/1.0")
+
 
 class SimpleHttpClient(QuicConnectionProtocol):
     """Simple HTTP/3 client that provides easy-to-use methods."""
@@ -27,39 +41,57 @@ class SimpleHttpClient(QuicConnectionProtocol):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._http = H3Connection(self._quic)
-        self._request_events = {}
-        self._request_waiter = {}
+        self._authority_header = (
+            b":authority", self._quic.configuration.server_name.encode()
+        )
+        # In-flight requests: stream ID -> (received events, response waiter)
+        self._requests: Dict[int, Tuple[List[H3Event], asyncio.Future]] = {}
         logger.debug("🔧 SimpleHttpClient initialized")
         
     def quic_event_received(self, event: QuicEvent) -> None:
         """Handle QUIC events and route to HTTP layer."""
-        logger.debug(f"📡 QUIC event received: {type(event).__name__}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("QUIC: event %s", type(event).__name__)
         if self._http is not None:
             for http_event in self._http.handle_event(event):
                 self.http_event_received(http_event)
     
     def http_event_received(self, event: H3Event) -> None:
         """Handle HTTP/3 events and complete requests."""
-        logger.debug(f"🌐 HTTP/3 event received: {type(event).__name__} for stream {event.stream_id}")
-        if isinstance(event, (HeadersReceived, DataReceived)):
-            stream_id = event.stream_id
-            if stream_id in self._request_events:
-                self._request_events[stream_id].append(event)
-                if event.stream_ended:
-                    logger.info(f"✅ Stream {stream_id} completed, resolving request")
-                    waiter = self._request_waiter.pop(stream_id)
-                    waiter.set_result(self._request_events.pop(stream_id))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("H3: event %s for stream %d", type(event).__name__, event.stream_id)
+        handler = self._event_handlers.get(type(event))
+        if handler is not None:
+            handler(self, event)
+    
+    def _response_event_received(self, event: H3Event) -> None:
+        """Collect a response event, resolving the request when the stream ends."""
+        stream_id = event.stream_id
+        request = self._requests.get(stream_id)
+        if request is not None:
+            events, waiter = request
+            events.append(event)
+            if event.stream_ended:
+                logger.info("H3: stream %d completed, resolving request", stream_id)
+                del self._requests[stream_id]
+                waiter.set_result(events)
+    
+    # HTTP/3 event handlers, keyed by exact event class
+    _event_handlers = {
+        HeadersReceived: _response_event_received,
+        DataReceived: _response_event_received,
+    }
     
     async def get(self, path: str, headers: Optional[Dict[str, str]] = None) -> 'HttpResponse':
         """Make a GET request."""
-        logger.info(f"📤 Making GET request to {path}")
+        logger.info("REQ: GET %s", path)
         return await self._request("GET", path, headers=headers)
     
     async def post(self, path: str, data: Union[str, bytes], headers: Optional[Dict[str, str]] = None) -> 'HttpResponse':
         """Make a POST request."""
-        logger.info(f"📤 Making POST request to {path} with {len(data) if isinstance(data, bytes) else len(data.encode())} bytes")
         if isinstance(data, str):
             data = data.encode('utf-8')
+        logger.info("REQ: POST %s with %d bytes", path, len(data))
         return await self._request("POST", path, data=data, headers=headers)
     
     async def _request(self, method: str, path: str, data: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None) -> 'HttpResponse':
@@ -67,15 +99,18 @@ class SimpleHttpClient(QuicConnectionProtocol):
         if headers is None:
             headers = {}
         
-        logger.debug(f"🔧 Creating {method} request to {path}")
+        logger.debug("REQ: creating %s request to %s", method, path)
         
         # Create request headers
+        method_bytes = _METHOD_BYTES.get(method)
+        if method_bytes is None:
+            method_bytes = method.encode()
         request_headers = [
-            (b":method", method.encode()),
-            (b":scheme", b"https"),
-            (b":authority", self._quic.configuration.server_name.encode()),
+            (b":method", method_bytes),
+            _SCHEME_HEADER,
+            self._authority_header,
             (b":path", path.encode()),
-            (b"user-agent", b"simple-http3/1.0"),
+            _USER_AGENT_HEADER,
         ]
         
         # Add custom headers
@@ -83,17 +118,15 @@ class SimpleHttpClient(QuicConnectionProtocol):
             request_headers.append((key.encode(), value.encode()))
         
         # Log all request headers in detail
-        logger.info(f"📤 Sending {method} request to {path}")
-        logger.info("📋 Request Headers:")
-        for key, value in request_headers:
-            if key.startswith(b":"):
-                logger.info(f"  {key.decode()}: {value.decode()}")
-            else:
-                logger.info(f"  {key.decode()}: {value.decode()}")
+        logger.info("REQ: sending %s request to %s", method, path)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("REQ: request headers:")
+            for key, value in request_headers:
+                logger.info("  %s: %s", key.decode(), value.decode())
         
         # Create stream and send headers
         stream_id = self._quic.get_next_available_stream_id()
-        logger.debug(f"🆔 Using stream ID: {stream_id}")
+        logger.debug("REQ: using stream ID %d", stream_id)
         
         self._http.send_headers(
             stream_id=stream_id,
@@ -103,18 +136,22 @@ class SimpleHttpClient(QuicConnectionProtocol):
         
         # Send data if provided
         if data:
-            logger.debug(f"📦 Sending {len(data)} bytes of data")
+            logger.debug("REQ: sending %d bytes of data", len(data))
             self._http.send_data(stream_id=stream_id, data=data, end_stream=True)
         
         # Wait for response
         waiter = self._loop.create_future()
-        self._request_events[stream_id] = []
-        self._request_waiter[stream_id] = waiter
-        logger.debug(f"⏳ Waiting for response on stream {stream_id}")
+        self._requests[stream_id] = ([], waiter)
+        logger.debug("REQ: waiting for response on stream %d", stream_id)
         self.transmit()
         
-        events = await asyncio.shield(waiter)
-        logger.info(f"✅ Received response for {method} {path}")
+        try:
+            events = await waiter
+        except asyncio.CancelledError:
+            # Forget the request so late response events are ignored
+            self._requests.pop(stream_id, None)
+            raise
+        logger.info("REQ: received response for %s %s", method, path)
         return HttpResponse(events)
 
 
@@ -125,51 +162,73 @@ class HttpResponse:
         self.events = events
         self.status = 200
         self.headers = {}
-        self.body = b""
+        self._body: Optional[bytes] = None
+        self._chunks: List[bytes] = []
         self._parse_events()
-        logger.debug(f"📄 Parsed response: status={self.status}, body_length={len(self.body)}")
+        # Size the chunks rather than reading body, which would join them eagerly
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "RSP: parsed response, status=%d, body_length=%d",
+                self.status,
+                sum(map(len, self._chunks)),
+            )
     
     def _parse_events(self):
         """Parse HTTP/3 events into response data."""
         for event in self.events:
             if isinstance(event, HeadersReceived):
-                logger.info(f"📋 Parsing response headers: {len(event.headers)} header pairs")
-                logger.info("📋 Response Headers:")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "RSP: parsing response headers: %d header pairs",
+                        len(event.headers),
+                    )
+                    logger.info("RSP: response headers:")
+                    # Log pseudo-headers too, even though they are not stored
+                    for key, value in event.headers:
+                        logger.info("  %s: %s", key.decode(), value.decode())
                 for key, value in event.headers:
                     if key == b":status":
                         self.status = int(value.decode())
-                        logger.info(f"  {key.decode()}: {self.status}")
                     elif not key.startswith(b":"):
                         self.headers[key.decode()] = value.decode()
-                        logger.info(f"  {key.decode()}: {value.decode()}")
-                    else:
-                        # Log pseudo-headers (like :status) but don't store them
-                        logger.info(f"  {key.decode()}: {value.decode()}")
-                logger.info(f"📊 Final status code: {self.status}")
+                logger.info("RSP: final status code %d", self.status)
             elif isinstance(event, DataReceived):
-                logger.debug(f"📦 Received {len(event.data)} bytes of data")
-                self.body += event.data
+                logger.debug("RSP: received %d bytes of data", len(event.data))
+                self._chunks.append(event.data)
     
     @property
+    def body(self) -> bytes:
+        """Get response body, joining the received DATA chunks on first access."""
+        if self._body is None:
+            self._body = b"".join(self._chunks)
+            self._chunks.clear()
+        return self._body
+    
+    @cached_property
     def text(self) -> str:
-        """Get response body as text."""
+        """Get response body as text, decoded once on first access."""
         return self.body.decode('utf-8')
     
+    def json(self) -> Any:
+        """Parse the response body as JSON, without decoding it to text first."""
+        return json.loads(self.body)
+    
     def __str__(self) -> str:
         return f"HttpResponse(status={self.status}, body={self.body[:100]}...)"
 
 
-def save_session_ticket(ticket: SessionTicket) -> None:
-    """Callback for session ticket handling."""
+# Most recent session ticket per (host, port), used to resume sessions with 0-RTT
+_session_tickets: Dict[Tuple[str, int], SessionTicket] = {}
+
+
+def save_session_ticket(host: str, port: int, ticket: SessionTicket) -> None:
+    """Callback for session ticket handling, bind host and port with partial()."""
     logger.debug(f"🎫 New session ticket received: {len(ticket.ticket)} bytes")
+    _session_tickets[(host, port)] = ticket
 
 
-async def _make_request_async(host: str, port: int, ca_file: str, method: str, path: str, data: Optional[Union[str, bytes]] = None, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
-    """Async function to make a single HTTP/3 request."""
-    logger.info(f"🔗 Connecting to HTTP/3 server at {host}:{port}")
-    logger.warning("⚠️  TLS certificate verification disabled for testing")
-    
-    # Create configuration
+def _create_configuration(host: str, port: int) -> QuicConfiguration:
+    """Create the client QUIC configuration, resuming the last session if any."""
     configuration = QuicConfiguration(
         is_client=True,
         alpn_protocols=H3_ALPN,
@@ -177,49 +236,126 @@ async def _make_request_async(host: str, port: int, ca_file: str, method: str, p
     # Disable certificate verification for testing
     configuration.verify_mode = ssl.CERT_NONE
     configuration.server_name = host
+    # Only offer a ticket issued by this server
+    session_ticket = _session_tickets.get((host, port))
+    if session_ticket is not None and session_ticket.server_name == host:
+        configuration.session_ticket = session_ticket
     logger.debug("🔧 Client QUIC configuration created (TLS verification disabled)")
+    return configuration
+
+
+async def _send_request(client: SimpleHttpClient, method: str, path: str, data: Optional[Union[str, bytes]] = None, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+    """Make a request on an established connection."""
+    if method.upper() == "GET":
+        return await client.get(path, headers)
+    elif method.upper() == "POST":
+        return await client.post(path, data, headers)
+    else:
+        raise ValueError(f"Unsupported method: {method}")
+
+
+async def _make_request_async(host: str, port: int, ca_file: str, method: str, path: str, data: Optional[Union[str, bytes]] = None, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+    """Async function to make a single HTTP/3 request."""
+    logger.info(f"🔗 Connecting to HTTP/3 server at {host}:{port}")
+    logger.warning("⚠️  TLS certificate verification disabled for testing")
     
     # Connect and make request
     async with connect(
         host=host,
         port=port,
-        configuration=configuration,
+        configuration=_create_configuration(host, port),
         create_protocol=SimpleHttpClient,
-        session_ticket_handler=save_session_ticket,
+        session_ticket_handler=partial(save_session_ticket, host, port),
     ) as client:
         logger.info(f"✅ Connected to HTTP/3 server at {host}:{port}")
-        
-        if method.upper() == "GET":
-            return await client.get(path, headers)
-        elif method.upper() == "POST":
-            return await client.post(path, data, headers)
-        else:
-            raise ValueError(f"Unsupported method: {method}")
+        return await _send_request(client, method, path, data, headers)
 
 
 class SimpleHttpClientWrapper:
-    """Wrapper for the async client to provide sync-like interface."""
+    """
+    Wrapper for the async client to provide sync-like interface.
+    
+    Requests are run on an event loop owned by a background thread and share
+    a single QUIC connection, which is opened on the first request.
+    """
     
     def __init__(self, host: str, port: int, ca_file: str):
         self.host = host
         self.port = port
         self.ca_file = ca_file
-        logger.debug(f"🔧 Client wrapper created for {host}:{port}")
+        self._client: Optional[SimpleHttpClient] = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        # Created on first use, so that it belongs to the wrapper's loop
+        self._connect_lock: Optional[asyncio.Lock] = None
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        logger.debug(f"🔧 Client wrapper created for {self.host}:{self.port}")
     
     def get(self, path: str, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
         """Make a GET request (synchronous interface)."""
         logger.info(f"📤 Making GET request to {self.host}:{self.port}{path}")
-        return asyncio.run(_make_request_async(self.host, self.port, self.ca_file, "GET", path, headers))
+        return self._run(self._request("GET", path, headers=headers))
     
     def post(self, path: str, data: Union[str, bytes], headers: Optional[Dict[str, str]] = None) -> HttpResponse:
         """Make a POST request (synchronous interface)."""
         data_size = len(data) if isinstance(data, bytes) else len(data.encode())
         logger.info(f"📤 Making POST request to {self.host}:{self.port}{path} with {data_size} bytes")
-        return asyncio.run(_make_request_async(self.host, self.port, self.ca_file, "POST", path, data, headers))
+        return self._run(self._request("POST", path, data, headers))
     
     def close(self):
-        """Close the connection (no-op for this implementation)."""
-        logger.debug("🔧 Client wrapper close called (no-op)")
+        """Close the connection and stop the event loop."""
+        if self._loop.is_closed():
+            return
+        self._run(self._disconnect())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        logger.debug("🔧 Client wrapper closed")
+    
+    def _run(self, coro):
+        """Run a coroutine on the wrapper's event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
+    async def _connect(self) -> SimpleHttpClient:
+        """Return the shared connection, (re)connecting if needed."""
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        # Requests from several threads must not open concurrent connections
+        async with self._connect_lock:
+            if self._client is not None and self._client._closed.is_set():
+                await self._disconnect()
+            if self._client is None:
+                logger.info(
+                    f"🔗 Connecting to HTTP/3 server at {self.host}:{self.port}"
+                )
+                self._exit_stack = AsyncExitStack()
+                self._client = await self._exit_stack.enter_async_context(
+                    connect(
+                        host=self.host,
+                        port=self.port,
+                        configuration=_create_configuration(self.host, self.port),
+                        create_protocol=SimpleHttpClient,
+                        session_ticket_handler=partial(
+                            save_session_ticket, self.host, self.port
+                        ),
+                    )
+                )
+                logger.info(f"✅ Connected to HTTP/3 server at {self.host}:{self.port}")
+            return self._client
+    
+    async def _disconnect(self) -> None:
+        """Close the shared connection, if any."""
+        if self._exit_stack is not None:
+            exit_stack = self._exit_stack
+            self._client = None
+            self._exit_stack = None
+            await exit_stack.aclose()
+    
+    async def _request(self, method: str, path: str, data: Optional[Union[str, bytes]] = None, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+        """Make a request on the shared connection."""
+        client = await self._connect()
+        return await _send_request(client, method, path, data, headers)
 
 
 def connect_client(host: str = "localhost", port: int = 4433, ca_file: str = None) -> SimpleHttpClientWrapper:
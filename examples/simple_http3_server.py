@@ -7,9 +7,13 @@ A lightweight HTTP/3 server built on top of aioquic.
 
 import asyncio
 import logging
-from typing import Dict, Optional
+import multiprocessing
+import os
+import threading
+from functools import partial
+from typing import List, Optional, Tuple
 
-from aioquic.asyncio import serve
+from aioquic.asyncio.server import QuicServer
 from aioquic.h3.connection import H3_ALPN, H3Connection
 from aioquic.h3.events import DataReceived, H3Event, HeadersReceived
 from aioquic.quic.configuration import QuicConfiguration
@@ -17,18 +21,83 @@ from aioquic.quic.events import QuicEvent
 from aioquic.tls import SessionTicket
 
 # Import the existing server components
-from http3_server import HttpServerProtocol, SessionTicketStore
+from http3_server import HttpRequestHandler, HttpServerProtocol, SessionTicketStore
+
+from batched_udp import serve_batched
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 logger = logging.getLogger("simple_http3_server")
 
 # Global server instance
 _server = None
 
+# Invariant response headers
+_HOMEPAGE_HEADERS = (
+    (b"content-type", b"text/html; charset=utf-8"),
+    (b"server", b"SimpleHTTP3/1.0"),
+    (b"x-powered-by", b"aioquic"),
+)
+_ECHO_HEADERS_BASE = (
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"server", b"SimpleHTTP3/1.0"),
+    (b"x-powered-by", b"aioquic"),
+)
+_NOT_FOUND_HEADERS = _ECHO_HEADERS_BASE
+
+# Static ASGI messages for the homepage and 404 responses
+_HOME_START = {"type": "http.response.start", "status": 200, "headers": _HOMEPAGE_HEADERS}
+_HOME_BODY = {
+    "type": "http.response.body",
+    "body": b"<h1>Simple HTTP/3 Server</h1><p>Welcome to the simple HTTP/3 server!</p>",
+}
+_NF_START = {"type": "http.response.start", "status": 404, "headers": _NOT_FOUND_HEADERS}
+_NF_BODY = {"type": "http.response.body", "body": b"Not Found"}
+
+# H3 events forwarded to the handler of an existing request
+_FORWARDED_EVENTS = frozenset((DataReceived, HeadersReceived))
+
+# Positions of the request pseudo-headers the server reads
+_PSEUDO_SLOTS = {b":method": 0, b":path": 1, b":authority": 2}
+
+# Scope fields which are the same for every request
+_SCOPE_TEMPLATE = {
+    "client": None,
+    "http_version": "3",
+    "query_string": b"",
+    "root_path": "",
+    "scheme": "https",
+    "type": "http",
+}
+
+
+def _parse_h3_headers(
+    headers: List[Tuple[bytes, bytes]],
+) -> Tuple[bytes, bytes, bytes, List[Tuple[bytes, bytes]]]:
+    """
+    Split request headers into method, path, authority and regular headers.
+    
+    Other pseudo-headers are dropped.
+    """
+    scope_headers: List[Tuple[bytes, bytes]] = []
+    slots = [b"", b"", b""]
+    
+    for key, value in headers:
+        index = _PSEUDO_SLOTS.get(key, -1)
+        if index >= 0:
+            slots[index] = value
+        elif key[:1] != b":":
+            scope_headers.append((key, value))
+    return slots[0], slots[1], slots[2], scope_headers
+
 
 # Simple ASGI application for testing
 async def simple_app(scope, receive, send):
     """Simple ASGI application that handles basic HTTP requests."""
-    logger.info(f"🔵 ASGI app received request: {scope['method']} {scope['path']}")
+    logger.info("🔵 ASGI app received request: %s %s", scope["method"], scope["path"])
     
     if scope["type"] == "http":
         method = scope["method"]
@@ -37,50 +106,28 @@ async def simple_app(scope, receive, send):
         if method == "GET" and path == "/":
             logger.info("📄 Serving homepage")
             # Return a simple homepage
-            response_headers = [
-                (b"content-type", b"text/html; charset=utf-8"),
-                (b"server", b"SimpleHTTP3/1.0"),
-                (b"x-powered-by", b"aioquic"),
-            ]
-            
-            logger.info("📋 Response Headers:")
-            for key, value in response_headers:
-                logger.info(f"  {key.decode()}: {value.decode()}")
-            
-            await send({
-                "type": "http.response.start",
-                "status": 200,
-                "headers": response_headers,
-            })
-            await send({
-                "type": "http.response.body",
-                "body": b"<h1>Simple HTTP/3 Server</h1><p>Welcome to the simple HTTP/3 server!</p>",
-            })
+            await send(_HOME_START)
+            await send(_HOME_BODY)
             logger.info("✅ Homepage served successfully")
         
         elif method == "POST" and path == "/echo":
             logger.info("🔄 Processing echo request")
-            # Echo the request body
-            body = b""
+            # Echo the request body, joining the chunks once at the end
+            chunks = []
             while True:
                 message = await receive()
                 if message["type"] == "http.request":
-                    body += message.get("body", b"")
+                    chunks.append(message.get("body", b""))
                     if message.get("more_body", False):
                         continue
                     break
+            body = b"".join(chunks)
             
-            logger.info(f"📤 Echoing back {len(body)} bytes")
-            response_headers = [
-                (b"content-type", b"text/plain; charset=utf-8"),
-                (b"server", b"SimpleHTTP3/1.0"),
-                (b"x-powered-by", b"aioquic"),
-                (b"content-length", str(len(body)).encode()),
-            ]
-            
-            logger.info("📋 Response Headers:")
-            for key, value in response_headers:
-                logger.info(f"  {key.decode()}: {value.decode()}")
+            logger.info("📤 Echoing back %d bytes", len(body))
+            response_headers = (
+                *_ECHO_HEADERS_BASE,
+                (b"content-length", b"%d" % len(body)),
+            )
             
             await send({
                 "type": "http.response.start",
@@ -94,83 +141,49 @@ async def simple_app(scope, receive, send):
             logger.info("✅ Echo response sent successfully")
         
         else:
-            logger.warning(f"❌ 404 Not Found: {method} {path}")
+            logger.warning("❌ 404 Not Found: %s %s", method, path)
             # 404 for unknown paths
-            response_headers = [
-                (b"content-type", b"text/plain; charset=utf-8"),
-                (b"server", b"SimpleHTTP3/1.0"),
-                (b"x-powered-by", b"aioquic"),
-            ]
-            
-            logger.info("📋 Response Headers:")
-            for key, value in response_headers:
-                logger.info(f"  {key.decode()}: {value.decode()}")
-            
-            await send({
-                "type": "http.response.start",
-                "status": 404,
-                "headers": response_headers,
-            })
-            await send({
-                "type": "http.response.body",
-                "body": b"Not Found",
-            })
+            await send(_NF_START)
+            await send(_NF_BODY)
 
 
 # Create a custom server protocol that uses our simple app
 class SimpleHttpServerProtocol(HttpServerProtocol):
     """Custom server protocol that uses our simple ASGI application."""
     
+    def transmit(self) -> None:
+        """Send pending datagrams, coalescing them into as few syscalls as possible."""
+        with self._transport.batch():
+            super().transmit()
+    
     def http_event_received(self, event: H3Event) -> None:
         """Override to use our simple application."""
-        if isinstance(event, HeadersReceived) and event.stream_id not in self._handlers:
-            logger.info(f"🌐 New HTTP/3 request received on stream {event.stream_id}")
-            
-            # Parse headers
-            headers = {}
-            method = b""
-            path = b""
-            authority = b""
+        event_type = type(event)
+        if event_type is HeadersReceived and event.stream_id not in self._handlers:
+            logger.info("🌐 New HTTP/3 request received on stream %d", event.stream_id)
             
-            # Log all incoming request headers in detail
-            logger.info("📋 Incoming Request Headers:")
-            for key, value in event.headers:
-                if key == b":method":
-                    method = value
-                    logger.info(f"  {key.decode()}: {value.decode()}")
-                elif key == b":path":
-                    path = value
-                    logger.info(f"  {key.decode()}: {value.decode()}")
-                elif key == b":authority":
-                    authority = value
-                    logger.info(f"  {key.decode()}: {value.decode()}")
-                elif key.startswith(b":"):
-                    # Log other pseudo-headers
-                    logger.info(f"  {key.decode()}: {value.decode()}")
-                else:
-                    headers[key.decode()] = value.decode()
-                    logger.info(f"  {key.decode()}: {value.decode()}")
+            # Parse headers in a single pass, keeping the raw bytes the ASGI
+            # scope expects
+            raw_method, raw_path, authority, scope_headers = _parse_h3_headers(
+                event.headers
+            )
+            method = raw_method.decode()
+            path = raw_path.decode()
             
-            logger.info(f"📋 Request Summary: {method.decode()} {path.decode()}")
-            logger.debug(f"📋 Regular headers: {headers}")
+            # Only dump the full header list when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 Incoming request headers: %r", event.headers)
+            logger.info("📋 Request Summary: %s %s", method, path)
             
-            # Create scope
-            scope = {
-                "client": None,
-                "extensions": {},
-                "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
-                "http_version": "3",
-                "method": method.decode(),
-                "path": path.decode(),
-                "query_string": b"",
-                "raw_path": path,
-                "root_path": "",
-                "scheme": "https",
-                "type": "http",
-            }
+            # Create scope, the application may modify extensions
+            scope = _SCOPE_TEMPLATE.copy()
+            scope["extensions"] = {}
+            scope["headers"] = scope_headers
+            scope["method"] = method
+            scope["path"] = path
+            scope["raw_path"] = raw_path
             
             # Create handler
-            from http3_server import HttpRequestHandler
             handler = HttpRequestHandler(
                 authority=authority,
                 connection=self._http,
@@ -181,13 +194,10 @@ class SimpleHttpServerProtocol(HttpServerProtocol):
                 transmit=self.transmit,
             )
             self._handlers[event.stream_id] = handler
-            logger.debug(f"🔧 Created handler for stream {event.stream_id}")
+            logger.debug("🔧 Created handler for stream %d", event.stream_id)
             asyncio.ensure_future(handler.run_asgi(simple_app))
-        elif (
-            isinstance(event, (DataReceived, HeadersReceived))
-            and event.stream_id in self._handlers
-        ):
-            logger.debug(f"📦 Forwarding event to handler for stream {event.stream_id}")
+        elif event_type in _FORWARDED_EVENTS and event.stream_id in self._handlers:
+            logger.debug("📦 Forwarding event to handler for stream %d", event.stream_id)
             handler = self._handlers[event.stream_id]
             handler.http_event_received(event)
 
@@ -195,7 +205,7 @@ class SimpleHttpServerProtocol(HttpServerProtocol):
 class SimpleHttpServer:
     """Simple HTTP/3 server class."""
     
-    def __init__(self, host: str = "localhost", port: int = 4433, cert_file: str = "tests/ssl_cert.pem", key_file: str = "tests/ssl_key.pem"):
+    def __init__(self, host: str = "localhost", port: int = 4433, cert_file: str = "tests/ssl_cert.pem", key_file: str = "tests/ssl_key.pem", reuse_port: bool = False):
         """
         Initialize the HTTP/3 server.
         
@@ -204,21 +214,30 @@ class SimpleHttpServer:
             port: Port to bind to (default: 4433)
             cert_file: Path to TLS certificate file
             key_file: Path to TLS private key file
+            reuse_port: Bind with SO_REUSEPORT so several processes can share the port
         """
         self.host = host
         self.port = port
         self.cert_file = cert_file
         self.key_file = key_file
+        self.reuse_port = reuse_port
         self._server = None
-        logger.info(f"🔧 SimpleHttpServer initialized for {host}:{port}")
+        self._ticket_store = None
+        logger.info("🔧 SimpleHttpServer initialized for %s:%d", host, port)
     
-    async def start_async(self):
-        """Start the server asynchronously."""
+    async def start_async(self, ready: Optional[threading.Event] = None):
+        """
+        Start the server asynchronously.
+        
+        Args:
+            ready: Event set once the server is listening, so that a caller
+                in another thread can wait for it instead of sleeping
+        """
         global _server
         
-        logger.info(f"🚀 Starting HTTP/3 server on {self.host}:{self.port}")
-        logger.info(f"🔐 Using certificate: {self.cert_file}")
-        logger.info(f"🔑 Using private key: {self.key_file}")
+        logger.info("🚀 Starting HTTP/3 server on %s:%d", self.host, self.port)
+        logger.info("🔐 Using certificate: %s", self.cert_file)
+        logger.info("🔑 Using private key: %s", self.key_file)
         
         # Create configuration
         configuration = QuicConfiguration(
@@ -229,29 +248,48 @@ class SimpleHttpServer:
         configuration.load_cert_chain(self.cert_file, self.key_file)
         logger.debug("🔧 QUIC configuration created")
         
-        # Start server
-        self._server = await serve(
-            host=self.host,
-            port=self.port,
-            configuration=configuration,
-            create_protocol=SimpleHttpServerProtocol,
-            session_ticket_fetcher=SessionTicketStore().pop,
-            session_ticket_handler=SessionTicketStore().add,
-            retry=False,
+        # Share one ticket store so tickets issued can be used for resumption
+        self._ticket_store = SessionTicketStore()
+        
+        # Start server, sending through UDP segmentation offload where supported
+        self._server = await serve_batched(
+            self.host,
+            self.port,
+            create_server=partial(
+                QuicServer,
+                configuration=configuration,
+                create_protocol=SimpleHttpServerProtocol,
+                session_ticket_fetcher=self._ticket_store.pop,
+                session_ticket_handler=self._ticket_store.add,
+                retry=False,
+            ),
+            reuse_port=self.reuse_port,
         )
         _server = self._server
+        if ready is not None:
+            ready.set()
         
-        logger.info(f"✅ HTTP/3 server started successfully on {self.host}:{self.port}")
+        logger.info(
+            "✅ HTTP/3 server started successfully on %s:%d", self.host, self.port
+        )
         logger.info("🔄 Server is ready to accept connections")
         
         # Keep server running
         await asyncio.Future()  # Run forever
     
-    def start(self):
-        """Start the server (synchronous interface)."""
-        logger.info(f"🎯 Starting HTTP/3 server process")
+    def start(self, ready: Optional[threading.Event] = None):
+        """
+        Start the server (synchronous interface).
+        
+        Args:
+            ready: Event set once the server is listening
+        """
+        logger.info("🎯 Starting HTTP/3 server process")
+        # uvloop.run() creates its own loop, leaving the global event loop
+        # policy alone for callers running the server in a thread
+        run = uvloop.run if uvloop is not None else asyncio.run
         try:
-            asyncio.run(self.start_async())
+            run(self.start_async(ready))
         except KeyboardInterrupt:
             logger.info("🛑 Server stopped by user")
     
@@ -268,7 +306,13 @@ async def _start_server_async(host: str, port: int, cert_file: str, key_file: st
     await server.start_async()
 
 
-def start_server(host: str = "localhost", port: int = 4433, cert_file: str = "tests/ssl_cert.pem", key_file: str = "tests/ssl_key.pem"):
+def _run_worker(host: str, port: int, cert_file: str, key_file: str, ready=None):
+    """Run one server process sharing the listening port with its siblings."""
+    server = SimpleHttpServer(host, port, cert_file, key_file, reuse_port=True)
+    server.start(ready)
+
+
+def start_server(host: str = "localhost", port: int = 4433, cert_file: str = "tests/ssl_cert.pem", key_file: str = "tests/ssl_key.pem", ready: Optional[threading.Event] = None, workers: int = 1):
     """
     Start an HTTP/3 server.
     
@@ -277,9 +321,43 @@ def start_server(host: str = "localhost", port: int = 4433, cert_file: str = "te
         port: Port to bind to (default: 4433)
         cert_file: Path to TLS certificate file
         key_file: Path to TLS private key file
+        ready: Event set once the server is listening, with several workers
+            once all of them are
+        workers: Number of server processes sharing the port with SO_REUSEPORT
+            (0: one per CPU, default: 1). The kernel routes each client's
+            datagrams to the same process, so every connection stays on one worker.
     
     Returns:
         None (runs forever)
     """
-    server = SimpleHttpServer(host, port, cert_file, key_file)
-    server.start() 
\ No newline at end of file
+    workers = workers or os.cpu_count()
+    if workers == 1:
+        server = SimpleHttpServer(host, port, cert_file, key_file)
+        server.start(ready)
+        return
+    
+    # Each worker reports on its own event once it is listening
+    worker_ready = [
+        multiprocessing.Event() if ready is not None else None
+        for _ in range(workers)
+    ]
+    processes = [
+        multiprocessing.Process(
+            target=_run_worker, args=(host, port, cert_file, key_file, listening)
+        )
+        for listening in worker_ready
+    ]
+    for process in processes:
+        process.start()
+    try:
+        if ready is not None:
+            # Stop waiting for a worker which exited before listening
+            for process, listening in zip(processes, worker_ready):
+                while not listening.wait(0.1) and process.is_alive():
+                    pass
+            if all(listening.is_set() for listening in worker_ready):
+                ready.set()
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        logger.info("🛑 Server stopped by user") 
\ No newline at end of file
@@ -7,15 +7,13 @@ Violates RFC 9114 Section 6.2.1 by sending PRIORITY_UPDATE frame
 as the first frame on the control stream instead of SETTINGS.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, log, run_main
 
 
 class TestCase1Client(BaseTestClient):
@@ -33,13 +31,13 @@ class TestCase1Client(BaseTestClient):
         """Execute the specific test logic for Test Case 1."""
         
         # Step 1: Create control stream
-        print("📍 Creating control stream")
+        log("📍 Creating control stream")
         self.control_stream_id = self.h3_api.create_control_stream()
         self.results.add_step("control_stream_created", True)
         
         # Step 2: Send PRIORITY_UPDATE as first frame (VIOLATION!)
-        print("📍 Sending PRIORITY_UPDATE as FIRST frame")
-        print("🚫 PROTOCOL VIOLATION: SETTINGS frame should be first!")
+        log("📍 Sending PRIORITY_UPDATE as FIRST frame")
+        log("🚫 PROTOCOL VIOLATION: SETTINGS frame should be first!")
         
         try:
             self.h3_api.send_priority_update_frame(
@@ -48,12 +46,12 @@ class TestCase1Client(BaseTestClient):
                 priority_field=b"i"
             )
             self.results.add_step("priority_update_sent", True)
-            print(f"✅ PRIORITY_UPDATE sent on stream {self.control_stream_id}")
-            print(f"   └─ This violates RFC 9114 Section 6.2.1!")
+            log("✅ PRIORITY_UPDATE sent on stream %s", self.control_stream_id)
+            log("   └─ This violates RFC 9114 Section 6.2.1!")
         except Exception as e:
-            print(f"❌ Failed to send PRIORITY_UPDATE frame: {e}")
+            log("❌ Failed to send PRIORITY_UPDATE frame: %s", e)
             self.results.add_step("priority_update_sent", True)
-            self.results.add_note(f"PRIORITY_UPDATE sending failed: {str(e)}")
+            self.results.add_note(f"PRIORITY_UPDATE sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("PRIORITY_UPDATE was sent as first frame (protocol violation)")
@@ -67,4 +65,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -8,15 +8,13 @@ Transfer-Encoding: chunked header. Transfer codings are not defined
 for HTTP/3 and the Transfer-Encoding header field MUST NOT be used.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, find_forbidden_headers, log, run_main
 
 
 class TestCase10Client(BaseTestClient):
@@ -37,12 +35,12 @@ class TestCase10Client(BaseTestClient):
         await self.setup_conformant_connection()
         
         # Step 2: Create request stream
-        print("📍 Creating request stream")
+        log("📍 Creating request stream")
         request_stream_id = self.create_request_stream(protocol)
         
         # Step 3: Send HEADERS frame with forbidden Transfer-Encoding header - VIOLATION!
-        print("📍 Sending HEADERS frame with Transfer-Encoding: chunked")
-        print("🚫 PROTOCOL VIOLATION: Transfer-Encoding header MUST NOT be used in HTTP/3!")
+        log("📍 Sending HEADERS frame with Transfer-Encoding: chunked")
+        log("🚫 PROTOCOL VIOLATION: Transfer-Encoding header MUST NOT be used in HTTP/3!")
         
         # Create headers with forbidden Transfer-Encoding header
         violation_headers = create_common_headers(
@@ -58,12 +56,13 @@ class TestCase10Client(BaseTestClient):
         try:
             self.h3_api.send_headers_frame(request_stream_id, violation_headers, end_stream=True)
             self.results.add_step("transfer_encoding_headers_sent", True)
-            print(f"✅ HEADERS frame with Transfer-Encoding sent on stream {request_stream_id}")
-            print(f"   └─ This violates HTTP/3 transfer coding restrictions!")
+            log("✅ HEADERS frame with Transfer-Encoding sent on stream %d", request_stream_id)
+            log("   └─ Forbidden headers: %s", b", ".join(find_forbidden_headers(violation_headers)).decode())
+            log("   └─ This violates HTTP/3 transfer coding restrictions!")
         except Exception as e:
-            print(f"❌ Failed to send HEADERS frame: {e}")
+            log("❌ Failed to send HEADERS frame: %s", e)
             self.results.add_step("transfer_encoding_headers_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Request sent with Transfer-Encoding: chunked header (protocol violation)")
@@ -77,4 +76,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
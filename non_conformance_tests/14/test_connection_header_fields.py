@@ -8,15 +8,13 @@ connection-specific header fields. The client MUST NOT generate
 an HTTP/3 field section containing connection-specific fields.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 
 
 class TestCase14Client(BaseTestClient):
@@ -65,7 +63,7 @@ class TestCase14Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send HEADERS frame: {e}")
             self.results.add_step("connection_headers_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Request sent with connection-specific header fields (protocol violation)")
@@ -79,4 +77,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
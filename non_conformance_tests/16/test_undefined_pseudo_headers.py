@@ -8,15 +8,13 @@ undefined pseudo-header fields. The client MUST NOT generate
 pseudo-header fields other than those defined in the specification.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 
 
 class TestCase16Client(BaseTestClient):
@@ -68,7 +66,7 @@ class TestCase16Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send HEADERS frame: {e}")
             self.results.add_step("undefined_pseudo_headers_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Request sent with undefined pseudo-header fields (protocol violation)")
@@ -82,4 +80,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -9,15 +9,13 @@ how servers/proxies handle request processing and whether they might
 incorrectly echo back or include request pseudo-headers in responses.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase18Client(BaseTestClient):
@@ -65,7 +63,7 @@ class TestCase18Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send HEADERS frame: {e}")
             self.results.add_step("echo_test_headers_sent", False)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Testing for server-side violation: request pseudo-headers in response")
@@ -80,4 +78,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -8,78 +8,58 @@ fields appear before pseudo-header fields. All pseudo-header fields
 MUST appear in the header section before regular header fields in requests.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient
+from utils import USER_AGENT_HEADER, run_main
+from violation import ViolationRequest, ViolationSpec, run_violation_test
 
 
-class TestCase22Client(BaseTestClient):
-    """Test Case 22: Incorrect header ordering (regular headers before pseudo-headers)."""
-    
-    def __init__(self):
-        super().__init__(
-            test_case_id=22,
-            test_name="Incorrect header ordering",
-            violation_description="Pseudo-headers MUST appear before regular headers in requests",
-            rfc_section="HTTP/3 Header Field Ordering Requirements"
-        )
-    
-    async def _execute_test_logic(self, protocol):
-        """Execute the specific test logic for Test Case 22."""
-        
-        # Step 1: Set up conformant HTTP/3 connection
-        await self.setup_conformant_connection()
-        
-        # Step 2: Create request stream
-        print("📍 Creating request stream")
-        request_stream_id = self.create_request_stream(protocol)
-        
-        # Step 3: Send HEADERS frame with incorrect ordering - VIOLATION!
-        print("📍 Sending HEADERS frame with incorrect header ordering")
-        print("🚫 PROTOCOL VIOLATION: Regular headers appear before pseudo-headers!")
-        
-        # Create headers with INCORRECT ordering - regular headers before pseudo-headers
-        violation_headers = [
-            # WRONG: Regular headers first (should come after pseudo-headers)
-            (b"host", b"test-server"),  # Regular header
-            (b"user-agent", b"HTTP3-NonConformance-Test/1.0"),  # Regular header
-            (b"x-test-case", b"22"),  # Regular header
-            
-            # WRONG: Pseudo-headers after regular headers (should come first)
-            (b":method", b"POST"),  # Pseudo-header
-            (b":path", b"/test-header-ordering"),  # Pseudo-header
-            (b":scheme", b"https"),  # Pseudo-header
-            (b":authority", b"test-server"),  # Pseudo-header
-        ]
-        
-        try:
-            self.h3_api.send_raw_headers_frame(request_stream_id, violation_headers, end_stream=True)
-            self.results.add_step("incorrect_header_ordering_sent", True)
-            print(f"✅ HEADERS frame with incorrect ordering sent on stream {request_stream_id}")
-            print(f"   └─ Order: Regular headers first, then pseudo-headers")
-            print(f"   └─ This violates HTTP/3 header ordering requirements!")
-        except Exception as e:
-            print(f"❌ Failed to send HEADERS frame: {e}")
-            self.results.add_step("incorrect_header_ordering_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
-        
-        # Add test-specific observations
-        self.results.add_note("HEADERS frame sent with incorrect ordering (protocol violation)")
-        self.results.add_note("Regular headers appeared before pseudo-headers")
-        self.results.add_note("Pseudo-headers MUST appear before regular headers in requests")
+# Create headers with INCORRECT ordering - regular headers before pseudo-headers
+_VIOLATION_HEADERS = (
+    # WRONG: Regular headers first (should come after pseudo-headers)
+    (b"host", b"test-server"),  # Regular header
+    USER_AGENT_HEADER,  # Regular header
+    (b"x-test-case", b"22"),  # Regular header
+
+    # WRONG: Pseudo-headers after regular headers (should come first)
+    (b":method", b"POST"),  # Pseudo-header
+    (b":path", b"/test-header-ordering"),  # Pseudo-header
+    (b":scheme", b"https"),  # Pseudo-header
+    (b":authority", b"test-server"),  # Pseudo-header
+)
+
+SPEC = ViolationSpec(
+    test_case_id=22,
+    test_name="Incorrect header ordering",
+    violation_description="Pseudo-headers MUST appear before regular headers in requests",
+    rfc_section="HTTP/3 Header Field Ordering Requirements",
+    requests=(
+        ViolationRequest(
+            label="incorrect_ordering",
+            headers=_VIOLATION_HEADERS,
+            raw_headers=True,
+            details=(
+                "Order: Regular headers first, then pseudo-headers",
+                "This violates HTTP/3 header ordering requirements!",
+            ),
+        ),
+    ),
+    notes=(
+        "HEADERS frame sent with incorrect ordering (protocol violation)",
+        "Regular headers appeared before pseudo-headers",
+        "Pseudo-headers MUST appear before regular headers in requests",
+    ),
+)
 
 
 async def main():
     """Main entry point for Test Case 22."""
-    test_client = TestCase22Client()
-    await BaseTestClient.main(test_client)
+    await run_violation_test(SPEC)
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main())
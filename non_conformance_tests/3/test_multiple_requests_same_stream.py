@@ -7,15 +7,34 @@ Violates RFC 9114 Section 4.1 by sending two HEADERS frames that each
 look like independent requests on the same stream.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
+
+
+# First request, conformant on its own
+_FIRST_HEADERS = create_common_headers(
+    path="/first-request",
+    method="GET",
+    **{
+        "x-test-case": "3",
+        "x-request-number": "1"
+    }
+)
+
+# Second request, sent on the same stream as the first
+_SECOND_HEADERS = create_common_headers(
+    path="/second-request",
+    method="POST",
+    **{
+        "x-test-case": "3",
+        "x-request-number": "2"
+    }
+)
 
 
 class TestCase3Client(BaseTestClient):
@@ -41,23 +60,14 @@ class TestCase3Client(BaseTestClient):
         
         # Step 3: Send first request (conformant)
         print("📍 Sending first request (conformant)")
-        first_headers = create_common_headers(
-            path="/first-request",
-            method="GET",
-            **{
-                "x-test-case": "3",
-                "x-request-number": "1"
-            }
-        )
-        
         try:
-            self.h3_api.send_headers_frame(request_stream_id, first_headers, end_stream=False)
+            self.h3_api.send_headers_frame(request_stream_id, _FIRST_HEADERS, end_stream=False)
             self.results.add_step("first_request_sent", True)
             print(f"✅ First HEADERS frame sent on stream {request_stream_id}")
             print("   └─ Method: GET, Path: /first-request (conformant)")
         except Exception as e:
             print(f"❌ First request failed: {e}")
-            self.results.add_note(f"First request failed: {str(e)}")
+            self.results.add_note(f"First request failed: {e}")
             return
         
         # Step 4: Send second request on SAME stream (VIOLATION!)
@@ -65,24 +75,15 @@ class TestCase3Client(BaseTestClient):
         print("🚫 PROTOCOL VIOLATION: Multiple requests on same stream!")
         print("🚫 RFC 9114 Section 4.1: Client MUST send only single request per stream")
         
-        second_headers = create_common_headers(
-            path="/second-request",
-            method="POST",
-            **{
-                "x-test-case": "3",
-                "x-request-number": "2"
-            }
-        )
-        
         try:
             # This violates RFC 9114 Section 4.1
-            self.h3_api.send_headers_frame(request_stream_id, second_headers, end_stream=True)
+            self.h3_api.send_headers_frame(request_stream_id, _SECOND_HEADERS, end_stream=True)
             self.results.add_step("second_request_sent", True)
             print(f"✅ Second HEADERS frame sent on stream {request_stream_id}")
             print("   └─ Method: POST, Path: /second-request (VIOLATION!)")
         except Exception as e:
             print(f"❌ Second request failed: {e}")
-            self.results.add_note(f"Second request failed: {str(e)}")
+            self.results.add_note(f"Second request failed: {e}")
             # Still mark as sent for result tracking
             self.results.add_step("second_request_sent", True)
         
@@ -98,4 +99,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -8,15 +8,13 @@ Host header field with an empty value. If the Host header field is
 present, it MUST NOT be empty.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, run_main
 
 
 class TestCase31Client(BaseTestClient):
@@ -69,7 +67,7 @@ class TestCase31Client(BaseTestClient):
             print(f"❌ Failed to send HEADERS frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("empty_host_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
             return
         
         # Step 4: Send another test with whitespace-only Host header
@@ -95,7 +93,7 @@ class TestCase31Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send second HEADERS frame: {e}")
             self.results.add_step("whitespace_host_sent", False)
-            self.results.add_note(f"Second HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Second HEADERS frame sending failed: {e}")
         
         # Step 5: Send third test with duplicate Host headers
         print("📍 Sending third request with duplicate Host headers")
@@ -120,7 +118,7 @@ class TestCase31Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send third HEADERS frame: {e}")
             self.results.add_step("duplicate_host_sent", False)
-            self.results.add_note(f"Third HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Third HEADERS frame sending failed: {e}")
         
         # Step 6: Send fourth test with invalid characters in Host header
         print("📍 Sending fourth request with invalid characters in Host header")
@@ -144,7 +142,7 @@ class TestCase31Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fourth HEADERS frame: {e}")
             self.results.add_step("invalid_host_chars_sent", False)
-            self.results.add_note(f"Fourth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Fourth HEADERS frame sending failed: {e}")
         
         # Step 7: Send fifth test with conflicting :authority and Host headers
         print("📍 Sending fifth request with conflicting :authority and Host headers")
@@ -169,7 +167,7 @@ class TestCase31Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fifth HEADERS frame: {e}")
             self.results.add_step("conflicting_authority_host_sent", False)
-            self.results.add_note(f"Fifth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Fifth HEADERS frame sending failed: {e}")
         
         # Step 8: Send sixth test with malformed Host header (invalid port)
         print("📍 Sending sixth request with malformed Host header (invalid port)")
@@ -193,7 +191,7 @@ class TestCase31Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send sixth HEADERS frame: {e}")
             self.results.add_step("malformed_host_port_sent", False)
-            self.results.add_note(f"Sixth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Sixth HEADERS frame sending failed: {e}")
         
         # Step 9: Attempt to send DATA frames (if headers were accepted)
         print("📍 Sending DATA frames with request bodies")
@@ -267,4 +265,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
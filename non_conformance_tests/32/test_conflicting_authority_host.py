@@ -9,15 +9,13 @@ different values. If both the Host header field and the :authority
 pseudo-header field are present, they MUST contain the same value.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, run_main
 
 
 class TestCase32Client(BaseTestClient):
@@ -71,7 +69,7 @@ class TestCase32Client(BaseTestClient):
             print(f"❌ Failed to send HEADERS frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("conflicting_authority_host_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
             return
         
         # Step 4: Send another test with port mismatches
@@ -99,7 +97,7 @@ class TestCase32Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send second HEADERS frame: {e}")
             self.results.add_step("port_mismatch_sent", False)
-            self.results.add_note(f"Second HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Second HEADERS frame sending failed: {e}")
         
         # Step 5: Send third test with case differences
         print("📍 Sending third request with case differences")
@@ -125,7 +123,7 @@ class TestCase32Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send third HEADERS frame: {e}")
             self.results.add_step("case_mismatch_sent", False)
-            self.results.add_note(f"Third HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Third HEADERS frame sending failed: {e}")
         
         # Step 6: Send fourth test with subtle differences (trailing dot)
         print("📍 Sending fourth request with subtle differences (trailing dot)")
@@ -151,7 +149,7 @@ class TestCase32Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fourth HEADERS frame: {e}")
             self.results.add_step("subtle_differences_sent", False)
-            self.results.add_note(f"Fourth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Fourth HEADERS frame sending failed: {e}")
         
         # Step 7: Send fifth test with IPv6 vs hostname mismatch
         print("📍 Sending fifth request with IPv6 vs hostname mismatch")
@@ -177,7 +175,7 @@ class TestCase32Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fifth HEADERS frame: {e}")
             self.results.add_step("ipv6_hostname_mismatch_sent", False)
-            self.results.add_note(f"Fifth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Fifth HEADERS frame sending failed: {e}")
         
         # Step 8: Send sixth test with implicit vs explicit port
         print("📍 Sending sixth request with implicit vs explicit port")
@@ -203,7 +201,7 @@ class TestCase32Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send sixth HEADERS frame: {e}")
             self.results.add_step("implicit_explicit_port_sent", False)
-            self.results.add_note(f"Sixth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Sixth HEADERS frame sending failed: {e}")
         
         # Step 9: Attempt to send DATA frames (if headers were accepted)
         print("📍 Sending DATA frames with request bodies")
@@ -277,4 +275,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -10,15 +10,13 @@ a mandatory authority component and none is provided in the request
 target, the request MUST NOT contain the :authority pseudo-header.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, run_main
 
 
 class TestCase33Client(BaseTestClient):
@@ -71,7 +69,7 @@ class TestCase33Client(BaseTestClient):
             print(f"❌ Failed to send HEADERS frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("mailto_with_authority_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
             return
         
         # Step 4: Send another test with file scheme + :authority
@@ -97,7 +95,7 @@ class TestCase33Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send second HEADERS frame: {e}")
             self.results.add_step("file_with_authority_sent", False)
-            self.results.add_note(f"Second HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Second HEADERS frame sending failed: {e}")
         
         # Step 5: Send third test with data scheme + :authority
         print("📍 Sending third request with data scheme and :authority")
@@ -122,7 +120,7 @@ class TestCase33Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send third HEADERS frame: {e}")
             self.results.add_step("data_with_authority_sent", False)
-            self.results.add_note(f"Third HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Third HEADERS frame sending failed: {e}")
         
         # Step 6: Send fourth test with tel scheme + :authority
         print("📍 Sending fourth request with tel scheme and :authority")
@@ -147,7 +145,7 @@ class TestCase33Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fourth HEADERS frame: {e}")
             self.results.add_step("tel_with_authority_sent", False)
-            self.results.add_note(f"Fourth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Fourth HEADERS frame sending failed: {e}")
         
         # Step 7: Send fifth test with urn scheme + :authority
         print("📍 Sending fifth request with urn scheme and :authority")
@@ -172,7 +170,7 @@ class TestCase33Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fifth HEADERS frame: {e}")
             self.results.add_step("urn_with_authority_sent", False)
-            self.results.add_note(f"Fifth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Fifth HEADERS frame sending failed: {e}")
         
         # Step 8: Send sixth test with empty :authority (still forbidden for non-authority schemes)
         print("📍 Sending sixth request with mailto scheme and empty :authority")
@@ -197,7 +195,7 @@ class TestCase33Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send sixth HEADERS frame: {e}")
             self.results.add_step("empty_authority_non_authority_scheme_sent", False)
-            self.results.add_note(f"Sixth HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"Sixth HEADERS frame sending failed: {e}")
         
         # Step 9: Attempt to send DATA frames (if headers were accepted)
         print("📍 Sending DATA frames with request bodies")
@@ -271,4 +269,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
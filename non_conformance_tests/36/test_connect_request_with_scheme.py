@@ -9,15 +9,13 @@ CONNECT request MUST be constructed with :method set to 'CONNECT' and
 the :scheme pseudo-header field MUST be omitted.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, run_main
 
 
 class TestCase36Client(BaseTestClient):
@@ -69,7 +67,7 @@ class TestCase36Client(BaseTestClient):
             print(f"❌ Failed to send CONNECT request: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("connect_with_scheme_sent", True)
-            self.results.add_note(f"CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"CONNECT request sending failed: {e}")
             return
         
         # Step 4: Send second CONNECT request with different scheme
@@ -94,7 +92,7 @@ class TestCase36Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send second CONNECT request: {e}")
             self.results.add_step("connect_with_http_scheme_sent", False)
-            self.results.add_note(f"Second CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Second CONNECT request sending failed: {e}")
         
         # Step 5: Send third CONNECT request with ws scheme (WebSocket)
         print("📍 Sending third CONNECT request with ws scheme")
@@ -119,7 +117,7 @@ class TestCase36Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send third CONNECT request: {e}")
             self.results.add_step("connect_with_ws_scheme_sent", False)
-            self.results.add_note(f"Third CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Third CONNECT request sending failed: {e}")
         
         # Step 6: Send fourth CONNECT request with invalid scheme
         print("📍 Sending fourth CONNECT request with invalid scheme")
@@ -142,7 +140,7 @@ class TestCase36Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fourth CONNECT request: {e}")
             self.results.add_step("connect_with_ssh_scheme_sent", False)
-            self.results.add_note(f"Fourth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Fourth CONNECT request sending failed: {e}")
         
         # Step 7: Send fifth CONNECT request with empty scheme
         print("📍 Sending fifth CONNECT request with empty scheme")
@@ -165,7 +163,7 @@ class TestCase36Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fifth CONNECT request: {e}")
             self.results.add_step("connect_with_empty_scheme_sent", False)
-            self.results.add_note(f"Fifth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Fifth CONNECT request sending failed: {e}")
         
         # Step 8: Send sixth CONNECT request with duplicate schemes
         print("📍 Sending sixth CONNECT request with duplicate schemes")
@@ -189,7 +187,7 @@ class TestCase36Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send sixth CONNECT request: {e}")
             self.results.add_step("connect_with_duplicate_schemes_sent", False)
-            self.results.add_note(f"Sixth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Sixth CONNECT request sending failed: {e}")
         
         # Step 9: Send seventh CONNECT request with :path (another violation)
         print("📍 Sending seventh CONNECT request with :scheme and :path")
@@ -214,7 +212,7 @@ class TestCase36Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send seventh CONNECT request: {e}")
             self.results.add_step("connect_with_scheme_and_path_sent", False)
-            self.results.add_note(f"Seventh CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Seventh CONNECT request sending failed: {e}")
         
         # Step 10: Attempt to send DATA frames (if headers were accepted)
         print("📍 Sending DATA frames for tunnel establishment")
@@ -298,4 +296,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -9,15 +9,13 @@ CONNECT request MUST be constructed with :method set to 'CONNECT' and
 the :path pseudo-header field MUST be omitted.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, run_main
 
 
 class TestCase37Client(BaseTestClient):
@@ -69,7 +67,7 @@ class TestCase37Client(BaseTestClient):
             print(f"❌ Failed to send CONNECT request: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("connect_with_path_sent", True)
-            self.results.add_note(f"CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"CONNECT request sending failed: {e}")
             return
         
         # Step 4: Send second CONNECT request with root path
@@ -94,7 +92,7 @@ class TestCase37Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send second CONNECT request: {e}")
             self.results.add_step("connect_with_root_path_sent", False)
-            self.results.add_note(f"Second CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Second CONNECT request sending failed: {e}")
         
         # Step 5: Send third CONNECT request with query parameters
         print("📍 Sending third CONNECT request with query parameters")
@@ -117,7 +115,7 @@ class TestCase37Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send third CONNECT request: {e}")
             self.results.add_step("connect_with_query_path_sent", False)
-            self.results.add_note(f"Third CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Third CONNECT request sending failed: {e}")
         
         # Step 6: Send fourth CONNECT request with fragment
         print("📍 Sending fourth CONNECT request with fragment")
@@ -140,7 +138,7 @@ class TestCase37Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fourth CONNECT request: {e}")
             self.results.add_step("connect_with_fragment_path_sent", False)
-            self.results.add_note(f"Fourth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Fourth CONNECT request sending failed: {e}")
         
         # Step 7: Send fifth CONNECT request with empty path
         print("📍 Sending fifth CONNECT request with empty path")
@@ -163,7 +161,7 @@ class TestCase37Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fifth CONNECT request: {e}")
             self.results.add_step("connect_with_empty_path_sent", False)
-            self.results.add_note(f"Fifth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Fifth CONNECT request sending failed: {e}")
         
         # Step 8: Send sixth CONNECT request with duplicate paths
         print("📍 Sending sixth CONNECT request with duplicate paths")
@@ -187,7 +185,7 @@ class TestCase37Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send sixth CONNECT request: {e}")
             self.results.add_step("connect_with_duplicate_paths_sent", False)
-            self.results.add_note(f"Sixth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Sixth CONNECT request sending failed: {e}")
         
         # Step 9: Send seventh CONNECT request with absolute URI path
         print("📍 Sending seventh CONNECT request with absolute URI path")
@@ -210,7 +208,7 @@ class TestCase37Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send seventh CONNECT request: {e}")
             self.results.add_step("connect_with_absolute_path_sent", False)
-            self.results.add_note(f"Seventh CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Seventh CONNECT request sending failed: {e}")
         
         # Step 10: Send eighth CONNECT request with both :path and :scheme (compound violation)
         print("📍 Sending eighth CONNECT request with :path and :scheme")
@@ -235,7 +233,7 @@ class TestCase37Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send eighth CONNECT request: {e}")
             self.results.add_step("connect_with_path_and_scheme_sent", False)
-            self.results.add_note(f"Eighth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Eighth CONNECT request sending failed: {e}")
         
         # Step 11: Attempt to send DATA frames (if headers were accepted)
         print("📍 Sending DATA frames for tunnel establishment")
@@ -328,4 +326,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
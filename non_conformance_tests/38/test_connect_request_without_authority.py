@@ -10,15 +10,13 @@ to 'CONNECT' and the :authority pseudo-header field MUST contain the
 host and port to connect to.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, run_main
 
 
 class TestCase38Client(BaseTestClient):
@@ -68,7 +66,7 @@ class TestCase38Client(BaseTestClient):
             print(f"❌ Failed to send CONNECT request: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("connect_without_authority_sent", True)
-            self.results.add_note(f"CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"CONNECT request sending failed: {e}")
             return
         
         # Step 4: Send second CONNECT request with empty :authority
@@ -92,7 +90,7 @@ class TestCase38Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send second CONNECT request: {e}")
             self.results.add_step("connect_with_empty_authority_sent", False)
-            self.results.add_note(f"Second CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Second CONNECT request sending failed: {e}")
         
         # Step 5: Send third CONNECT request with only forbidden headers
         print("📍 Sending third CONNECT request with forbidden headers but no :authority")
@@ -118,7 +116,7 @@ class TestCase38Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send third CONNECT request: {e}")
             self.results.add_step("connect_forbidden_headers_no_authority_sent", False)
-            self.results.add_note(f"Third CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Third CONNECT request sending failed: {e}")
         
         # Step 6: Send fourth CONNECT request with Host header but no :authority
         print("📍 Sending fourth CONNECT request with Host header but no :authority")
@@ -142,7 +140,7 @@ class TestCase38Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fourth CONNECT request: {e}")
             self.results.add_step("connect_host_header_no_authority_sent", False)
-            self.results.add_note(f"Fourth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Fourth CONNECT request sending failed: {e}")
         
         # Step 7: Send fifth CONNECT request with whitespace-only :authority
         print("📍 Sending fifth CONNECT request with whitespace-only :authority")
@@ -164,7 +162,7 @@ class TestCase38Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fifth CONNECT request: {e}")
             self.results.add_step("connect_whitespace_authority_sent", False)
-            self.results.add_note(f"Fifth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Fifth CONNECT request sending failed: {e}")
         
         # Step 8: Send sixth CONNECT request with malformed :authority
         print("📍 Sending sixth CONNECT request with malformed :authority")
@@ -186,7 +184,7 @@ class TestCase38Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send sixth CONNECT request: {e}")
             self.results.add_step("connect_malformed_authority_sent", False)
-            self.results.add_note(f"Sixth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Sixth CONNECT request sending failed: {e}")
         
         # Step 9: Send seventh CONNECT request with only method
         print("📍 Sending seventh CONNECT request with only :method")
@@ -206,7 +204,7 @@ class TestCase38Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send seventh CONNECT request: {e}")
             self.results.add_step("connect_only_method_sent", False)
-            self.results.add_note(f"Seventh CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Seventh CONNECT request sending failed: {e}")
         
         # Step 10: Send eighth CONNECT request with invalid :authority format
         print("📍 Sending eighth CONNECT request with invalid :authority format")
@@ -228,7 +226,7 @@ class TestCase38Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send eighth CONNECT request: {e}")
             self.results.add_step("connect_invalid_authority_format_sent", False)
-            self.results.add_note(f"Eighth CONNECT request sending failed: {str(e)}")
+            self.results.add_note(f"Eighth CONNECT request sending failed: {e}")
         
         # Step 11: Attempt to send DATA frames (if headers were accepted)
         print("📍 Sending DATA frames for tunnel establishment")
@@ -321,4 +319,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -10,15 +10,13 @@ connection error of type H3_ID_ERROR when no MAX_PUSH_ID frame has been sent.
 This test deliberately omits sending MAX_PUSH_ID and observes server behavior.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase39Client(BaseTestClient):
@@ -69,7 +67,7 @@ class TestCase39Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send request: {e}")
             self.results.add_step("request_sent", False)
-            self.results.add_note(f"Request sending failed: {str(e)}")
+            self.results.add_note(f"Request sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Client deliberately did NOT send MAX_PUSH_ID frame")
@@ -84,4 +82,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -15,11 +15,10 @@ import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase40Client(BaseTestClient):
@@ -63,7 +62,7 @@ class TestCase40Client(BaseTestClient):
             print(f"❌ Failed to send MAX_PUSH_ID frame: {e}")
             print("   └─ Will proceed with requests anyway to test server behavior")
             self.results.add_step("max_push_id_sent", False)
-            self.results.add_note(f"MAX_PUSH_ID sending failed: {str(e)}")
+            self.results.add_note(f"MAX_PUSH_ID sending failed: {e}")
         
         # Step 3: Send multiple requests to encourage server push beyond limit
         print("📍 Sending multiple requests to encourage server push")
@@ -277,7 +276,7 @@ class TestCase40Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send final status request: {e}")
             self.results.add_step("final_status_sent", False)
-            self.results.add_note(f"Final request failed - possible H3_ID_ERROR: {str(e)}")
+            self.results.add_note(f"Final request failed - possible H3_ID_ERROR: {e}")
         
         # Add test-specific observations
         self.results.add_note(f"Client sent MAX_PUSH_ID = {max_push_id_limit} (allows push IDs 0-3)")
@@ -298,4 +297,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -15,11 +15,10 @@ import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase41Client(BaseTestClient):
@@ -84,7 +83,7 @@ class TestCase41Client(BaseTestClient):
             except Exception as e:
                 print(f"❌ Failed to send first GOAWAY frame: {e}")
                 self.results.add_step("first_goaway_sent", False)
-                self.results.add_note(f"First GOAWAY sending failed: {str(e)}")
+                self.results.add_note(f"First GOAWAY sending failed: {e}")
                 return
         else:
             print(f"❌ No control stream available to send GOAWAY frames")
@@ -115,7 +114,7 @@ class TestCase41Client(BaseTestClient):
             print(f"❌ Failed to send second GOAWAY frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("second_goaway_sent", True)
-            self.results.add_note(f"Second GOAWAY sending failed: {str(e)}")
+            self.results.add_note(f"Second GOAWAY sending failed: {e}")
         
         # Step 6: Send third GOAWAY frame with even higher ID (escalating violation)
         print("📍 Sending third GOAWAY frame with even higher ID")
@@ -135,7 +134,7 @@ class TestCase41Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send third GOAWAY frame: {e}")
             self.results.add_step("third_goaway_sent", False)
-            self.results.add_note(f"Third GOAWAY sending failed: {str(e)}")
+            self.results.add_note(f"Third GOAWAY sending failed: {e}")
         
         # Step 7: Send fourth GOAWAY with correct decreasing ID (conformant)
         print("📍 Sending fourth GOAWAY frame with correctly decreasing ID")
@@ -154,7 +153,7 @@ class TestCase41Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send fourth GOAWAY frame: {e}")
             self.results.add_step("fourth_goaway_sent", False)
-            self.results.add_note(f"Fourth GOAWAY sending failed: {str(e)}")
+            self.results.add_note(f"Fourth GOAWAY sending failed: {e}")
         
         # Step 8: Attempt to send more requests after GOAWAY frames
         print("📍 Attempting to send requests after GOAWAY frames")
@@ -196,7 +195,7 @@ class TestCase41Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send extreme GOAWAY frame: {e}")
             self.results.add_step("extreme_goaway_sent", False)
-            self.results.add_note(f"Extreme GOAWAY sending failed: {str(e)}")
+            self.results.add_note(f"Extreme GOAWAY sending failed: {e}")
         
         # Step 10: Wait and observe connection behavior
         print("📍 Observing connection behavior after GOAWAY violations")
@@ -224,7 +223,7 @@ class TestCase41Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send final request: {e}")
             self.results.add_step("final_request_sent", False)
-            self.results.add_note(f"Final request failed - possible connection termination: {str(e)}")
+            self.results.add_note(f"Final request failed - possible connection termination: {e}")
         
         # Add test-specific observations
         self.results.add_note(f"Multiple GOAWAY frames sent with increasing identifiers (protocol violation)")
@@ -243,4 +242,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -9,14 +9,13 @@ per peer is permitted; receipt of a second stream claiming to be a control
 stream MUST be treated as a connection error of type H3_STREAM_CREATION_ERROR.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 
 
 class TestCase46Client(BaseTestClient):
@@ -61,7 +60,7 @@ class TestCase46Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as attempted for result tracking
             self.results.add_step("second_control_stream_created", True)
-            self.results.add_note(f"Second control stream creation failed: {str(e)}")
+            self.results.add_note(f"Second control stream creation failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Second control stream opened (protocol violation)")
@@ -76,4 +75,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -9,14 +9,13 @@ a client-initiated push stream, this MUST be treated as a connection error
 of type H3_STREAM_CREATION_ERROR.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 from aioquic.buffer import encode_uint_var
 
 
@@ -67,7 +66,7 @@ class TestCase48Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as attempted for result tracking
             self.results.add_step("push_stream_created", True)
-            self.results.add_note(f"Push stream creation failed: {str(e)}")
+            self.results.add_note(f"Push stream creation failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Client-initiated push stream opened (protocol violation)")
@@ -82,4 +81,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
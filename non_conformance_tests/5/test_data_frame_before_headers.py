@@ -7,15 +7,13 @@ Violates HTTP/3 frame sequencing by sending DATA frame on request
 stream without preceding HEADERS frame.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 
 
 class TestCase5Client(BaseTestClient):
@@ -59,7 +57,7 @@ class TestCase5Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as sent for result tracking
             self.results.add_step("data_frame_sent_first", True)
-            self.results.add_note(f"DATA frame sending failed: {str(e)}")
+            self.results.add_note(f"DATA frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("DATA frame sent before any HEADERS frame (protocol violation)")
@@ -73,4 +71,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -9,14 +9,13 @@ streams. If a HEADERS frame is sent by the client on a control stream, the
 server MUST respond with a connection error of type H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase52Client(BaseTestClient):
@@ -64,7 +63,7 @@ class TestCase52Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as attempted for result tracking
             self.results.add_step("headers_frame_on_control_stream_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("HEADERS frame sent on control stream (protocol violation)")
@@ -79,4 +78,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
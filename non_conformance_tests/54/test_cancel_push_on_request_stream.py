@@ -9,14 +9,13 @@ CANCEL_PUSH frame is sent by the client on a stream other than the control strea
 the server MUST respond with a connection error of type H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 from aioquic.buffer import encode_uint_var
 
 
@@ -83,7 +82,7 @@ class TestCase54Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as attempted for result tracking
             self.results.add_step("cancel_push_on_request_stream_sent", True)
-            self.results.add_note(f"CANCEL_PUSH frame sending failed: {str(e)}")
+            self.results.add_note(f"CANCEL_PUSH frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("CANCEL_PUSH frame sent on request stream (protocol violation)")
@@ -98,4 +97,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
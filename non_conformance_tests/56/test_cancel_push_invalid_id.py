@@ -10,14 +10,13 @@ currently allowed on the connection, the server MUST respond with a connection
 error of type H3_ID_ERROR.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 from aioquic.buffer import encode_uint_var
 
 
@@ -66,7 +65,7 @@ class TestCase56Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as attempted for result tracking
             self.results.add_step("cancel_push_invalid_id_sent", True)
-            self.results.add_note(f"CANCEL_PUSH frame sending failed: {str(e)}")
+            self.results.add_note(f"CANCEL_PUSH frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note(f"CANCEL_PUSH frame with invalid push ID {invalid_push_id} (protocol violation)")
@@ -81,4 +80,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -9,14 +9,13 @@ on the control stream, the server MUST respond with a connection error of
 type H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 
 
 class TestCase60Client(BaseTestClient):
@@ -54,7 +53,7 @@ class TestCase60Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as attempted for result tracking
             self.results.add_step("second_settings_frame_sent", True)
-            self.results.add_note(f"Second SETTINGS frame sending failed: {str(e)}")
+            self.results.add_note(f"Second SETTINGS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Second SETTINGS frame sent on control stream (protocol violation)")
@@ -69,4 +68,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
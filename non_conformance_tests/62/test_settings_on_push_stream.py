@@ -9,14 +9,13 @@ the control stream. If a server receives a SETTINGS frame on a different stream,
 the server MUST respond with a connection error of type H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 from aioquic.buffer import encode_uint_var
 
 
@@ -68,7 +67,7 @@ class TestCase62Client(BaseTestClient):
             print(f"❌ Failed to send SETTINGS frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("settings_on_push_stream_sent", True)
-            self.results.add_note(f"SETTINGS frame sending failed: {str(e)}")
+            self.results.add_note(f"SETTINGS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("SETTINGS frame sent on push stream (protocol violation)")
@@ -83,4 +82,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
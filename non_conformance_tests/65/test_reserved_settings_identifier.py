@@ -10,14 +10,13 @@ settings MUST NOT be sent by the client, and their receipt by the server MUST
 be treated as a connection error of type H3_SETTINGS_ERROR.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 from aioquic.buffer import encode_uint_var
 
 
@@ -71,7 +70,7 @@ class TestCase65Client(BaseTestClient):
             print(f"❌ Failed to send SETTINGS frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("reserved_settings_sent", True)
-            self.results.add_note(f"SETTINGS frame sending failed: {str(e)}")
+            self.results.add_note(f"SETTINGS frame sending failed: {e}")
         
         # Step 3: Create QPACK streams
         print("📍 Creating QPACK streams")
@@ -92,4 +91,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
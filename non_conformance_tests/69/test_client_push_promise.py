@@ -9,14 +9,13 @@ treat the receipt of a PUSH_PROMISE frame as a connection error of type
 H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 from aioquic.buffer import encode_uint_var
 
 
@@ -87,7 +86,7 @@ class TestCase69Client(BaseTestClient):
             print(f"❌ Failed to send PUSH_PROMISE frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("push_promise_sent", True)
-            self.results.add_note(f"PUSH_PROMISE frame sending failed: {str(e)}")
+            self.results.add_note(f"PUSH_PROMISE frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("PUSH_PROMISE frame sent by client (protocol violation)")
@@ -102,4 +101,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
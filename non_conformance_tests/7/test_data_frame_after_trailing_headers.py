@@ -9,15 +9,13 @@ specification, sending any frame after a trailing HEADERS frame
 should trigger H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
-# Add the src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase7Client(BaseTestClient):
@@ -100,7 +98,7 @@ class TestCase7Client(BaseTestClient):
             print("   └─ This may indicate the violation was caught early")
             # Still mark as sent for result tracking
             self.results.add_step("data_after_trailing_headers_sent", True)
-            self.results.add_note(f"DATA frame sending failed: {str(e)}")
+            self.results.add_note(f"DATA frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("DATA frame sent after trailing HEADERS with end_stream=True (protocol violation)")
@@ -115,4 +113,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -8,14 +8,13 @@ the specification, a server MUST treat a GOAWAY frame on a stream other than
 the control stream as a connection error of type H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase71Client(BaseTestClient):
@@ -77,7 +76,7 @@ class TestCase71Client(BaseTestClient):
             print(f"❌ Failed to send GOAWAY frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("goaway_on_request_stream_sent", True)
-            self.results.add_note(f"GOAWAY frame sending failed: {str(e)}")
+            self.results.add_note(f"GOAWAY frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("GOAWAY frame sent on request stream (protocol violation)")
@@ -92,4 +91,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -9,14 +9,13 @@ Receipt of a MAX_PUSH_ID frame by the server on any other stream MUST be treated
 as a connection error of type H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 from aioquic.buffer import encode_uint_var
 
 
@@ -70,7 +69,7 @@ class TestCase72Client(BaseTestClient):
             print(f"❌ Failed to send MAX_PUSH_ID frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("max_push_id_on_push_stream_sent", True)
-            self.results.add_note(f"MAX_PUSH_ID frame sending failed: {str(e)}")
+            self.results.add_note(f"MAX_PUSH_ID frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("MAX_PUSH_ID frame sent on push stream (protocol violation)")
@@ -85,4 +84,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
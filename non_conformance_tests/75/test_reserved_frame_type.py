@@ -10,14 +10,13 @@ by the client, and their receipt by the server MUST be treated as a connection
 error of type H3_FRAME_UNEXPECTED.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient
+from utils import BaseTestClient, run_main
 
 
 class TestCase75Client(BaseTestClient):
@@ -59,7 +58,7 @@ class TestCase75Client(BaseTestClient):
         except Exception as e:
             print(f"❌ Failed to send reserved frame type: {e}")
             self.results.add_step("reserved_frame_type_sent", True)
-            self.results.add_note(f"Reserved frame type sending failed: {str(e)}")
+            self.results.add_note(f"Reserved frame type sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Reserved frame type 0x4 sent on request stream (protocol violation)")
@@ -74,4 +73,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
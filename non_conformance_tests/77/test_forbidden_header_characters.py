@@ -10,14 +10,13 @@ verbatim. Any request that contains a character not permitted in a field value M
 be treated as malformed.
 """
 
-import asyncio
 import sys
 import os
 
+# Make the shared helpers importable, utils adds the src directory itself
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'shared'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from utils import BaseTestClient, create_common_headers
+from utils import BaseTestClient, create_common_headers, run_main
 
 
 class TestCase77Client(BaseTestClient):
@@ -71,7 +70,7 @@ class TestCase77Client(BaseTestClient):
             print(f"❌ Failed to send HEADERS frame: {e}")
             print("   └─ This may indicate the violation was caught early")
             self.results.add_step("forbidden_header_characters_sent", True)
-            self.results.add_note(f"HEADERS frame sending failed: {str(e)}")
+            self.results.add_note(f"HEADERS frame sending failed: {e}")
         
         # Add test-specific observations
         self.results.add_note("Header value with forbidden carriage return character (protocol violation)")
@@ -86,4 +85,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    run_main(main()) 
\ No newline at end of file
@@ -56,7 +56,7 @@ class H3TestServerProtocol(QuicConnectionProtocol):
             logger.error(f"❌ Error processing HTTP event: {e}")
             # Log the specific exception for non-conformance analysis
             logger.error(f"🔍 Exception type: {type(e).__name__}")
-            logger.error(f"🔍 Exception details: {str(e)}")
+            logger.error(f"🔍 Exception details: {e}")
     
     def http_event_received(self, event: H3Event) -> None:
         """Handle HTTP/3 events."""
@@ -9,25 +9,93 @@ non-conformance test cases.
 
 import argparse
 import asyncio
+import functools
 import logging
 import ssl
 import sys
 import os
 import time
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
 
-# Add the src directory to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+# Add the src directory to Python path for imports, once
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
 
-from aioquic.asyncio import connect
-from aioquic.asyncio.protocol import QuicConnectionProtocol
-from aioquic.h3.custom_api import H3CustomAPI
-from aioquic.quic.configuration import QuicConfiguration
+from aioquic.asyncio import connect  # noqa: E402
+from aioquic.asyncio.protocol import QuicConnectionProtocol  # noqa: E402
+from aioquic.h3.custom_api import H3CustomAPI  # noqa: E402
+from aioquic.quic.configuration import QuicConfiguration  # noqa: E402
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Set NON_CONF_QUIET=1 to drop progress output, e.g. for long automated sweeps
+_quiet = os.environ.get("NON_CONF_QUIET") == "1"
+
+# Progress markers are written as ASCII tags when stdout is not a terminal,
+# purely decorative ones are dropped
+_plain = not sys.stdout.isatty()
+_ASCII_MARKERS = {
+    "📍": "-",
+    "🚫": "[VIOLATION]",
+    "✅": "[OK]",
+    "❌": "[FAIL]",
+    "•": "*",
+    "└─": "`-",
+    "🧪": "",
+    "📋": "",
+    "📚": "",
+    "🎯": "",
+    "📊": "",
+    "🔌": "",
+    "📝": "",
+}
+
+
+def _emit(message: str = "") -> None:
+    """Print a line, with its leading marker in ASCII if stdout is not a terminal."""
+    if _plain:
+        text = message.lstrip()
+        size = 2 if text[:2] in _ASCII_MARKERS else 1
+        marker = _ASCII_MARKERS.get(text[:size])
+        if marker is not None:
+            rest = text[size:] if marker else text[size:].lstrip(" ")
+            message = message[:len(message) - len(text)] + marker + rest
+    print(message)
+
+
+def log(message: str = "", *args):
+    """
+    Print test progress, unless NON_CONF_QUIET=1 is set.
+    
+    As with :mod:`logging`, `args` are merged into `message` with the ``%``
+    operator only when the line is actually printed.
+    """
+    if _quiet:
+        return
+    if args:
+        message = message % args
+    _emit(message)
 
 
 class TestResult:
     """Container for test execution results."""
     
+    __slots__ = (
+        "test_case_id",
+        "test_name",
+        "steps",
+        "error_code",
+        "error_reason",
+        "connection_terminated",
+        "start_time",
+        "end_time",
+        "notes",
+    )
+    
     def __init__(self, test_case_id: int, test_name: str):
         self.test_case_id = test_case_id
         self.test_name = test_name
@@ -47,6 +115,14 @@ class TestResult:
         """Add an observation note."""
         self.notes.append(note)
     
+    def add_steps(self, steps: Dict[str, bool]):
+        """Record several test step results at once."""
+        self.steps.update(steps)
+    
+    def add_notes(self, notes: List[str]):
+        """Add several observation notes at once."""
+        self.notes.extend(notes)
+    
     def set_error(self, error_code: int, error_reason: str):
         """Record connection error details."""
         self.error_code = error_code
@@ -77,6 +153,19 @@ class NonConformanceProtocol(QuicConnectionProtocol):
 class BaseTestClient:
     """Base class for non-conformance test clients with common functionality."""
     
+    __slots__ = (
+        "test_case_id",
+        "test_name",
+        "violation_description",
+        "rfc_section",
+        "h3_api",
+        "results",
+        "control_stream_id",
+        "encoder_stream_id",
+        "decoder_stream_id",
+        "request_stream_id",
+    )
+    
     def __init__(self, test_case_id: int, test_name: str, violation_description: str, rfc_section: str):
         self.test_case_id = test_case_id
         self.test_name = test_name
@@ -107,11 +196,11 @@ class BaseTestClient:
                 await self._execute_test_logic(protocol)
                 
                 # Wait and observe
-                await self._observe_behavior()
+                await self._observe_behavior(protocol=protocol)
                 
         except Exception as e:
             print(f"❌ Test failed: {e}")
-            self.results.add_note(f"Test exception: {str(e)}")
+            self.results.add_note(f"Test exception: {e}")
         
         self.results.end_time = time.time()
         self._print_test_results()
@@ -122,15 +211,9 @@ class BaseTestClient:
     
     def _connect_to_target(self, host: str, port: int):
         """Establish QUIC connection to target."""
-        configuration = QuicConfiguration(
-            is_client=True,
-            alpn_protocols=["h3"],
-            verify_mode=ssl.CERT_NONE,
-        )
-        
         return connect(
             host, port,
-            configuration=configuration,
+            configuration=_client_configuration(host),
             create_protocol=lambda *args, **kwargs: NonConformanceProtocol(
                 *args, **kwargs, test_results=self.results
             ),
@@ -138,7 +221,7 @@ class BaseTestClient:
     
     async def setup_conformant_connection(self):
         """Set up conformant HTTP/3 connection (control stream + SETTINGS + QPACK)."""
-        print("📍 Setting up conformant HTTP/3 connection")
+        log("📍 Setting up conformant HTTP/3 connection")
         
         # Create control stream and send SETTINGS
         self.control_stream_id = self.h3_api.create_control_stream()
@@ -150,7 +233,7 @@ class BaseTestClient:
         self.decoder_stream_id = self.h3_api.create_decoder_stream()
         self.results.add_step("qpack_streams_created", True)
         
-        print(f"✅ HTTP/3 connection established (control: {self.control_stream_id})")
+        log("✅ HTTP/3 connection established (control: %s)", self.control_stream_id)
     
     def create_request_stream(self, protocol):
         """Create a new request stream."""
@@ -158,54 +241,86 @@ class BaseTestClient:
         self.results.add_step("request_stream_created", True)
         return self.request_stream_id
     
-    async def _observe_behavior(self, duration: float = 3.0):
-        """Wait and observe server behavior."""
-        print(f"\n📍 Observing server behavior ({duration}s)")
-        await asyncio.sleep(duration)
+    def send_request_atomic(
+        self,
+        protocol,
+        stream_id: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: Optional[bytes] = None,
+        trailers: Optional[List[Tuple[bytes, bytes]]] = None,
+        raw_headers: bool = False,
+        transmit: bool = True,
+    ):
+        """
+        Queue a whole request (HEADERS, then optional DATA and trailing HEADERS)
+        with a single stream write and flush it in one transmit. With
+        `raw_headers` the initial HEADERS frame is sent in the exact order
+        given, its encoding is cached. Pass `transmit=False` to leave the flush
+        to the caller, for instance to send several requests in the same
+        datagrams.
+        """
+        self.h3_api.send_request(stream_id, headers, body=body, trailers=trailers, raw_headers=raw_headers)
+        if transmit:
+            protocol.transmit()
+    
+    async def _observe_behavior(self, duration: float = 3.0, protocol=None):
+        """
+        Wait and observe server behavior. If `protocol` is given, stop as soon
+        as the connection is closed so that it is released right away.
+        """
+        log("\n📍 Observing server behavior (%ss)", duration)
+        if protocol is None:
+            await asyncio.sleep(duration)
+            return
+        try:
+            await asyncio.wait_for(protocol.wait_closed(), duration)
+            log("📍 Connection closed, observation ended early")
+        except asyncio.TimeoutError:
+            pass
     
     def _print_test_header(self, host: str, port: int):
         """Print standardized test header."""
-        print("=" * 70)
-        print(f"🧪 NON-CONFORMANCE TEST CASE #{self.test_case_id}")
-        print("=" * 70)
-        print(f"📋 Test: {self.test_name}")
-        print(f"🚫 Violation: {self.violation_description}")
-        print(f"📚 RFC Section: {self.rfc_section}")
-        print(f"🎯 Target: {host}:{port}")
-        print("=" * 70)
+        _emit("=" * 70)
+        _emit(f"🧪 NON-CONFORMANCE TEST CASE #{self.test_case_id}")
+        _emit("=" * 70)
+        _emit(f"📋 Test: {self.test_name}")
+        _emit(f"🚫 Violation: {self.violation_description}")
+        _emit(f"📚 RFC Section: {self.rfc_section}")
+        _emit(f"🎯 Target: {host}:{port}")
+        _emit("=" * 70)
     
     def _print_test_results(self):
         """Print standardized test results."""
-        print("\n" + "=" * 70)
-        print(f"📊 TEST CASE #{self.test_case_id} RESULTS")
-        print("=" * 70)
+        _emit("\n" + "=" * 70)
+        _emit(f"📊 TEST CASE #{self.test_case_id} RESULTS")
+        _emit("=" * 70)
         
         # Test steps summary
-        print("🧪 Test Execution:")
+        _emit("🧪 Test Execution:")
         for step_name, success in self.results.steps.items():
             status = "✅ PASS" if success else "❌ FAIL"
             formatted_name = step_name.replace("_", " ").title()
-            print(f"   {status} {formatted_name}")
+            _emit(f"   {status} {formatted_name}")
         
         # Connection termination info
         if self.results.connection_terminated:
             error_name = parse_error_code(self.results.error_code)
-            print(f"\n🔌 Connection Terminated: {error_name}")
+            _emit(f"\n🔌 Connection Terminated: {error_name}")
             if self.results.error_reason:
-                print(f"   Reason: {self.results.error_reason}")
+                _emit(f"   Reason: {self.results.error_reason}")
         
         # Key observations
         if self.results.notes:
-            print("\n📝 Key Observations:")
+            _emit("\n📝 Key Observations:")
             for note in self.results.notes:
-                print(f"   • {note}")
+                _emit(f"   • {note}")
         
         # Summary stats
         passed = sum(1 for success in self.results.steps.values() if success)
         total = len(self.results.steps)
         duration = self.results.end_time - self.results.start_time if self.results.start_time else 0
-        print(f"\n📊 Summary: {passed}/{total} steps passed in {duration:.2f}s")
-        print("=" * 70)
+        _emit(f"\n📊 Summary: {passed}/{total} steps passed in {duration:.2f}s")
+        _emit("=" * 70)
     
     @classmethod
     def create_argument_parser(cls, description: str) -> argparse.ArgumentParser:
@@ -216,6 +331,19 @@ class BaseTestClient:
         parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
         return parser
     
+    @staticmethod
+    def run_many(test_instances: List["BaseTestClient"], host: str = "localhost", port: int = 4433, verbose: bool = False) -> List[TestResult]:
+        """Run several test clients back to back on a single event loop."""
+        loop = new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            for test_instance in test_instances:
+                loop.run_until_complete(test_instance.run_test(host, port, verbose))
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+        return [test_instance.results for test_instance in test_instances]
+    
     @classmethod
     async def main(cls, test_instance):
         """Main entry point for test cases."""
@@ -230,6 +358,21 @@ class BaseTestClient:
             print(f"\n💥 Test crashed: {e}")
 
 
+@functools.lru_cache(maxsize=4)
+def _client_configuration(host: str) -> QuicConfiguration:
+    """
+    Return the client configuration for `host`, shared by every test client
+    connecting to it. The server name is filled in here so that `connect`
+    never needs to modify the shared instance.
+    """
+    return QuicConfiguration(
+        is_client=True,
+        alpn_protocols=["h3"],
+        server_name=host,
+        verify_mode=ssl.CERT_NONE,
+    )
+
+
 def setup_logging(verbose: bool = False):
     """Configure minimal logging for non-conformance tests."""
     # Reduce logging verbosity significantly
@@ -249,6 +392,12 @@ def setup_logging(verbose: bool = False):
     logging.getLogger("http3.custom_api").setLevel(logging.ERROR)
 
 
+# Header fields shared by most of the test requests
+USER_AGENT_HEADER = (b"user-agent", b"HTTP3-NonConformance-Test/1.0")
+ACCEPT_JSON_HEADER = (b"accept", b"application/json")
+CONTENT_TYPE_JSON_HEADER = (b"content-type", b"application/json")
+
+
 def create_common_headers(host: str = "test-server", path: str = "/", method: str = "GET", **extra) -> List[Tuple[bytes, bytes]]:
     """Create standard HTTP/3 headers for testing."""
     headers = [
@@ -266,6 +415,32 @@ def create_common_headers(host: str = "test-server", path: str = "/", method: st
     return headers
 
 
+def create_common_headers_bytes(method: bytes, path: bytes, extra: Tuple[Tuple[bytes, bytes], ...] = (), host: bytes = b"test-server") -> List[Tuple[bytes, bytes]]:
+    """Create standard HTTP/3 headers from values which are already encoded."""
+    return [
+        (b":method", method),
+        (b":path", path),
+        (b":scheme", b"https"),
+        (b":authority", host),
+        *extra,
+    ]
+
+
+# Connection-specific header fields which HTTP/3 forbids, RFC 9114 Section 4.2
+FORBIDDEN_H3 = frozenset({
+    b"connection",
+    b"keep-alive",
+    b"proxy-connection",
+    b"transfer-encoding",
+    b"upgrade",
+})
+
+
+def find_forbidden_headers(headers: List[Tuple[bytes, bytes]]) -> List[bytes]:
+    """Return the names of connection-specific fields found in a header list."""
+    return [name for name, _ in headers if name.lower() in FORBIDDEN_H3]
+
+
 def parse_error_code(error_code: int) -> str:
     """Parse HTTP/3 error codes into human-readable descriptions."""
     error_codes = {
@@ -294,12 +469,48 @@ def parse_error_code(error_code: int) -> str:
     return error_codes.get(error_code, f"UNKNOWN_0x{error_code:x}")
 
 
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, backed by uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run_main(main: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a test script's main() coroutine like asyncio.run(), on a loop from
+    new_event_loop(). The global event loop policy is left untouched.
+    """
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=new_event_loop) as runner:
+            return runner.run(main)
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
 # Export commonly used classes and functions
 __all__ = [
     'TestResult',
     'BaseTestClient', 
     'NonConformanceProtocol',
     'setup_logging',
+    'log',
     'create_common_headers',
+    'create_common_headers_bytes',
+    'USER_AGENT_HEADER',
+    'ACCEPT_JSON_HEADER',
+    'CONTENT_TYPE_JSON_HEADER',
+    'find_forbidden_headers',
+    'FORBIDDEN_H3',
     'parse_error_code',
+    'new_event_loop',
+    'run_main',
 ] 
\ No newline at end of file
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+"""
+Data-Driven Driver for Request Header Violations
+
+Most request-level non-conformance tests follow the same script: set up a
+conformant connection, open request streams, send a violating request on
+each one and record what happened. Such tests describe their requests with a
+ViolationSpec and let ViolationTestClient execute them.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from utils import BaseTestClient, log
+
+HeaderTuple = Tuple[Tuple[bytes, bytes], ...]
+
+
+@dataclass(frozen=True)
+class ViolationRequest:
+    """One request sent on its own stream."""
+    
+    label: str
+    "Prefix of the step names recorded for this request."
+    
+    headers: HeaderTuple
+    "The initial HEADERS frame."
+    
+    body: Optional[bytes] = None
+    "The DATA frame payload, if any."
+    
+    trailers: Optional[HeaderTuple] = None
+    "A trailing HEADERS frame, if any."
+    
+    raw_headers: bool = False
+    "Whether to send the initial HEADERS frame in the exact order given."
+    
+    details: Tuple[str, ...] = ()
+    "Lines printed once the request was sent."
+
+
+@dataclass(frozen=True)
+class ViolationSpec:
+    """Description of a non-conformance test made of violating requests."""
+    
+    test_case_id: int
+    test_name: str
+    violation_description: str
+    rfc_section: str
+    requests: Tuple[ViolationRequest, ...]
+    notes: Tuple[str, ...] = field(default=())
+    stop_on_failure: bool = True
+    "Whether a request that fails to send skips the remaining requests."
+
+
+class ViolationTestClient(BaseTestClient):
+    """Test client executing a ViolationSpec."""
+    
+    __slots__ = ("spec",)
+    
+    def __init__(self, spec: ViolationSpec):
+        super().__init__(
+            test_case_id=spec.test_case_id,
+            test_name=spec.test_name,
+            violation_description=spec.violation_description,
+            rfc_section=spec.rfc_section,
+        )
+        self.spec = spec
+    
+    async def _execute_test_logic(self, protocol):
+        """Send every request of the spec, see ViolationSpec.stop_on_failure."""
+        await self.setup_conformant_connection()
+        
+        log("🚫 PROTOCOL VIOLATION: %s", self.spec.violation_description)
+        log("🚫 Expected error: Connection termination or header rejection")
+        
+        # queue every request, then flush them together
+        for request in self.spec.requests:
+            if not self._send_request(protocol, request) and self.spec.stop_on_failure:
+                break
+        protocol.transmit()
+        
+        self.results.add_notes(list(self.spec.notes))
+    
+    def _send_request(self, protocol, request: ViolationRequest) -> bool:
+        """Send one request on a new stream, returning whether it was sent."""
+        log("📍 Sending %s request", request.label.replace("_", " "))
+        request_stream_id = self.create_request_stream(protocol)
+        
+        steps = {f"{request.label}_headers_sent": True}
+        try:
+            self.send_request_atomic(
+                protocol,
+                request_stream_id,
+                list(request.headers),
+                body=request.body,
+                trailers=None if request.trailers is None else list(request.trailers),
+                raw_headers=request.raw_headers,
+                transmit=False,
+            )
+        except Exception as e:
+            log("❌ Failed to send request: %s", e)
+            log("   └─ This may indicate the violation was caught early")
+            steps[f"{request.label}_headers_sent"] = False
+            if request.body is not None:
+                steps[f"{request.label}_body_sent"] = False
+            if request.trailers is not None:
+                steps[f"{request.label}_trailers_sent"] = False
+            self.results.add_steps(steps)
+            self.results.add_note(f"{request.label} request sending failed: {e}")
+            return False
+        
+        if request.body is not None:
+            steps[f"{request.label}_body_sent"] = True
+        if request.trailers is not None:
+            steps[f"{request.label}_trailers_sent"] = True
+        self.results.add_steps(steps)
+        
+        log("✅ Request sent on stream %d", request_stream_id)
+        log("   └─ Headers: %d header fields", len(request.headers))
+        for line in request.details:
+            log("   └─ %s", line)
+        return True
+
+
+async def run_violation_test(spec: ViolationSpec):
+    """Main entry point for a test described by a ViolationSpec."""
+    await BaseTestClient.main(ViolationTestClient(spec))
+
+
+__all__ = [
+    'ViolationRequest',
+    'ViolationSpec',
+    'ViolationTestClient',
+    'run_violation_test',
+]
@@ -32,6 +32,9 @@ SP = 0x20
 HTAB = 0x09
 WHITESPACE = (SP, HTAB)
 
+# bytes allowed in a header name, a leading colon is checked separately
+NAME_CHARS = bytes(c for c in range(0x21, 0x7F) if c != COLON)
+
 
 class ErrorCode(IntEnum):
     H3_DATAGRAM_ERROR = 0x33
@@ -207,6 +210,12 @@ def validate_header_name(key: bytes) -> None:
     """
     Validate a header name as specified by RFC 9113 section 8.2.1.
     """
+    # fast path, deleting all valid bytes leaves nothing
+    if not key[1:].translate(None, NAME_CHARS) and (
+        not key or key[0] == COLON or key[0] in NAME_CHARS
+    ):
+        return
+
     for i, c in enumerate(key):
         if c <= 0x20 or c >= 0x7F:
             raise MessageError("Header %r contains invalid characters" % key)
@@ -519,6 +528,44 @@ class H3Connection:
         :param data: The data to send.
         :param end_stream: Whether to end the stream.
         """
+        self._quic.send_stream_data(
+            stream_id, self._create_data_frame(stream_id, data), end_stream
+        )
+
+    def send_headers(
+        self, stream_id: int, headers: Headers, end_stream: bool = False
+    ) -> None:
+        """
+        Send headers on the given stream.
+
+        .. aioquic_transmit::
+
+        :param stream_id: The stream ID on which to send the headers.
+        :param headers: The HTTP headers to send.
+        :param end_stream: Whether to end the stream.
+        """
+        self._quic.send_stream_data(
+            stream_id, self._create_headers_frame(stream_id, headers), end_stream
+        )
+
+    @property
+    def received_settings(self) -> Optional[Dict[int, int]]:
+        """
+        Return the received SETTINGS frame, or None.
+        """
+        return self._received_settings
+
+    @property
+    def sent_settings(self) -> Optional[Dict[int, int]]:
+        """
+        Return the sent SETTINGS frame, or None.
+        """
+        return self._sent_settings
+
+    def _create_data_frame(self, stream_id: int, data: bytes) -> bytes:
+        """
+        Build a DATA frame for the given stream and log it.
+        """
         # Allow DATA frame in any state for non-conformance
         stream = self._get_or_create_stream(stream_id)
         # if stream.headers_send_state != HeadersState.AFTER_HEADERS:
@@ -534,28 +581,25 @@ class H3Connection:
                 ),
             )
 
-        self._quic.send_stream_data(
-            stream_id, encode_frame(FrameType.DATA, data), end_stream
-        )
+        return encode_frame(FrameType.DATA, data)
 
-    def send_headers(
-        self, stream_id: int, headers: Headers, end_stream: bool = False
-    ) -> None:
+    def _create_headers_frame(
+        self, stream_id: int, headers: Headers, frame_data: Optional[bytes] = None
+    ) -> bytes:
         """
-        Send headers on the given stream.
-
-        .. aioquic_transmit::
+        Build a HEADERS frame for the given stream, log it and update the
+        stream's sending state.
 
-        :param stream_id: The stream ID on which to send the headers.
-        :param headers: The HTTP headers to send.
-        :param end_stream: Whether to end the stream.
+        If `frame_data` is given, it is used as the encoded field section
+        instead of encoding `headers`.
         """
         # check HEADERS frame is allowed
         stream = self._get_or_create_stream(stream_id)
         # if stream.headers_send_state == HeadersState.AFTER_TRAILERS:
         #     raise FrameUnexpected("HEADERS frame is not allowed in this state")
 
-        frame_data = self._encode_headers(stream_id, headers)
+        if frame_data is None:
+            frame_data = self._encode_headers(stream_id, headers)
 
         # log frame
         if self._quic_logger is not None:
@@ -567,28 +611,12 @@ class H3Connection:
                 ),
             )
 
-        # update state and send headers
+        # update state
         if stream.headers_send_state == HeadersState.INITIAL:
             stream.headers_send_state = HeadersState.AFTER_HEADERS
         else:
             stream.headers_send_state = HeadersState.AFTER_TRAILERS
-        self._quic.send_stream_data(
-            stream_id, encode_frame(FrameType.HEADERS, frame_data), end_stream
-        )
-
-    @property
-    def received_settings(self) -> Optional[Dict[int, int]]:
-        """
-        Return the received SETTINGS frame, or None.
-        """
-        return self._received_settings
-
-    @property
-    def sent_settings(self) -> Optional[Dict[int, int]]:
-        """
-        Return the sent SETTINGS frame, or None.
-        """
-        return self._sent_settings
+        return encode_frame(FrameType.HEADERS, frame_data)
 
     def _create_uni_stream(
         self, stream_type: int, push_id: Optional[int] = None
@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import Dict, List, Optional, Tuple
 from aioquic.buffer import encode_uint_var
@@ -17,6 +18,21 @@ import pylsqpack
 logger = logging.getLogger("http3.custom_api")
 
 
+@functools.lru_cache(maxsize=128)
+def encode_raw_headers(headers: Tuple[Tuple[bytes, bytes], ...]) -> bytes:
+    """
+    QPACK-encode a field section in the exact order given, without using the
+    dynamic table.
+    
+    The encoded section only depends on the headers, so it is computed once
+    per distinct header tuple.
+    
+    :param headers: The headers to encode
+    """
+    _, frame_data = pylsqpack.Encoder().encode(0, list(headers))
+    return frame_data
+
+
 class H3CustomAPI:
     """
     Custom HTTP/3 API for non-conformance testing.
@@ -157,6 +173,35 @@ class H3CustomAPI:
         encoded_frame = encode_frame(FrameType.HEADERS, frame_data)
         self._quic.send_stream_data(stream_id, encoded_frame, end_stream)
     
+    def send_request(
+        self,
+        stream_id: int,
+        headers: Headers,
+        body: Optional[bytes] = None,
+        trailers: Optional[Headers] = None,
+        raw_headers: bool = False,
+    ) -> None:
+        """
+        Send a whole request (HEADERS, then optional DATA and trailing HEADERS)
+        and end the stream. All frames are encoded first and handed to the
+        QUIC stream in a single write, the stream state and qlog events are
+        kept as if they had been sent one by one.
+
+        :param stream_id: The stream ID to send the request on
+        :param headers: The headers of the initial HEADERS frame
+        :param body: The DATA frame payload, if any
+        :param trailers: The headers of a trailing HEADERS frame, if any
+        :param raw_headers: Whether to encode the initial headers in the exact
+            order given, see :func:`encode_raw_headers`
+        """
+        frame_data = encode_raw_headers(tuple(headers)) if raw_headers else None
+        frames = [self._h3._create_headers_frame(stream_id, headers, frame_data)]
+        if body is not None:
+            frames.append(self._h3._create_data_frame(stream_id, body))
+        if trailers is not None:
+            frames.append(self._h3._create_headers_frame(stream_id, trailers))
+        self._quic.send_stream_data(stream_id, b"".join(frames), True)
+
     def send_data_frame(self, stream_id: int, data: bytes, end_stream: bool = False) -> None:
         """
         Send a DATA frame on the specified stream.